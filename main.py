@@ -6,6 +6,8 @@ FastAPI server entry point for AI Job Application Agent
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
+import asyncio
+import sys
 from src.api import router
 from src.auth_routes import auth_router
 from src.job_routes import router as job_router
@@ -26,6 +28,13 @@ from src.admin.admin_routes import admin_router
 
 from src.database import init_database, check_database
 
+# uvloop has no Windows build; fall back to the stock asyncio loop there
+try:
+    import uvloop  # noqa: F401
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 # Create FastAPI app
 app = FastAPI(
     title="AI Job Application Agent API",
@@ -141,9 +150,16 @@ async def api_options(path: str):
     return {"message": "OK"}
 
 if __name__ == "__main__":
+    # psycopg's async driver (website routes) can't run on the Proactor loop
+    # Windows uses by default
+    if sys.platform == "win32":
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+    
     uvicorn.run(
         "main:app", 
         host="0.0.0.0", 
         port=8000, 
-        reload=True
+        reload=True,
+        loop="uvloop" if UVLOOP_AVAILABLE else "asyncio",
+        http="httptools"
     )
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Database Migration: Case-insensitive unique index on website names
+Adds the LOWER(name) unique index that website configuration inserts use as
+their ON CONFLICT target
+"""
+
+from sqlalchemy import create_engine, text
+
+from config import Config
+
+INDEX_NAME = "idx_website_configurations_lower_name"
+
+
+def create_website_name_index():
+    """Create the unique LOWER(name) index on website_configurations"""
+    engine = create_engine(Config.DATABASE_URL)
+
+    try:
+        with engine.begin() as conn:
+            print("🚀 Adding case-insensitive unique index on website names")
+            print("=" * 50)
+
+            duplicates = conn.execute(
+                text(
+                    """
+                    SELECT LOWER(name), COUNT(*)
+                    FROM website_configurations
+                    GROUP BY LOWER(name)
+                    HAVING COUNT(*) > 1
+                    """
+                )
+            ).fetchall()
+
+            if duplicates:
+                print("❌ Website names that differ only by case must be merged first:")
+                for name, count in duplicates:
+                    print(f"   • {name} ({count} rows)")
+                return False
+
+            print(f"📝 Creating {INDEX_NAME}...")
+            conn.execute(
+                text(
+                    f"""
+                    CREATE UNIQUE INDEX IF NOT EXISTS {INDEX_NAME}
+                    ON website_configurations (LOWER(name))
+                    """
+                )
+            )
+
+        print("✅ Database migration completed!")
+        return True
+
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        return False
+
+    finally:
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    success = create_website_name_index()
+    if not success:
+        print("💡 Make sure DATABASE_URL points to your PostgreSQL database.")
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Database Migration: Store website selectors as JSONB
+Converts the TEXT selector columns of website_configurations to JSONB so the
+API can bind and read selector maps without serializing them in Python
+"""
+
+from sqlalchemy import create_engine, text
+
+from config import Config
+
+SELECTOR_COLUMNS = ["search_selectors", "job_selectors", "form_selectors"]
+
+
+def migrate_website_selectors_to_jsonb():
+    """Convert website_configurations selector columns from TEXT to JSONB"""
+    engine = create_engine(Config.DATABASE_URL)
+
+    try:
+        with engine.begin() as conn:
+            print("🚀 Converting website selector columns to JSONB")
+            print("=" * 50)
+
+            column_types = dict(
+                conn.execute(
+                    text(
+                        """
+                        SELECT column_name, data_type
+                        FROM information_schema.columns
+                        WHERE table_name = 'website_configurations'
+                        """
+                    )
+                ).fetchall()
+            )
+
+            if not column_types:
+                print("❌ website_configurations table not found")
+                return False
+
+            for column in SELECTOR_COLUMNS:
+                if column_types.get(column) == "jsonb":
+                    print(f"ℹ️ {column} is already JSONB")
+                    continue
+
+                print(f"🔄 Converting {column}...")
+                conn.execute(
+                    text(
+                        f"""
+                        ALTER TABLE website_configurations
+                        ALTER COLUMN {column} TYPE JSONB
+                        USING NULLIF({column}, '')::jsonb
+                        """
+                    )
+                )
+                print(f"✅ {column} converted")
+
+        print("✅ Database migration completed!")
+        return True
+
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        return False
+
+    finally:
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    success = migrate_website_selectors_to_jsonb()
+    if not success:
+        print("💡 Make sure DATABASE_URL points to your PostgreSQL database.")
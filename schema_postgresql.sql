@@ -304,10 +304,10 @@ CREATE TABLE
         job_search_url VARCHAR(500) NOT NULL,
         login_required BOOLEAN DEFAULT FALSE,
         login_url VARCHAR(500),
-        -- CSS/XPath selectors stored as JSON
-        search_selectors TEXT, -- JSON: {"keywords": "#search-input", "location": "#location-input"}
-        job_selectors TEXT, -- JSON: {"job_title": ".job-title", "company": ".company-name"}
-        form_selectors TEXT, -- JSON: {"apply_button": ".apply-btn", "resume_upload": "input[type='file']"}
+        -- CSS/XPath selectors stored as JSONB
+        search_selectors JSONB, -- {"keywords": "#search-input", "location": "#location-input"}
+        job_selectors JSONB, -- {"job_title": ".job-title", "company": ".company-name"}
+        form_selectors JSONB, -- {"apply_button": ".apply-btn", "resume_upload": "input[type='file']"}
         -- Pagination and scraping settings
         pagination_selector VARCHAR(255),
         max_pages INTEGER DEFAULT 5,
@@ -359,6 +359,9 @@ CREATE INDEX IF NOT EXISTS idx_user_profiles_auth_provider ON user_profiles (aut
 CREATE INDEX IF NOT EXISTS idx_job_sources_enabled ON job_sources(enabled);
 CREATE INDEX IF NOT EXISTS idx_job_sources_last_sync ON job_sources(last_sync);
 
+-- Website configuration names are unique case-insensitively
+CREATE UNIQUE INDEX IF NOT EXISTS idx_website_configurations_lower_name ON website_configurations (LOWER(name));
+
 -- ===================================
 -- INITIAL DATA
 -- ===================================
@@ -4,10 +4,12 @@ Google Jobs API Integration Setup Script
 Automates the complete setup process for Google Jobs API integration
 """
 
+import argparse
 import subprocess
 import sys
 import os
 import asyncio
+from typing import Optional
 
 def run_command(command, description):
     """Run a shell command and return success status"""
@@ -63,8 +65,12 @@ async def test_api_integration():
         print(f"❌ API Integration Test: FAILED - {str(e)}")
         return False
 
-def main():
-    """Main setup process"""
+def main(continue_on_error: Optional[bool] = None):
+    """Main setup process
+
+    continue_on_error decides whether to go on after a required step fails;
+    when it is None the user is asked.
+    """
     print("🚀 Google Jobs API Integration Setup")
     print("=" * 50)
     
@@ -88,7 +94,10 @@ def main():
         if not success and step["required"]:
             all_success = False
             print(f"\n❌ Required step failed: {step['description']}")
-            if input("\nContinue anyway? (y/N): ").lower() != 'y':
+            if continue_on_error is None:
+                if input("\nContinue anyway? (y/N): ").lower() != 'y':
+                    break
+            elif not continue_on_error:
                 break
     
     # Test the integration
@@ -116,4 +125,11 @@ def main():
         print("   3. Test API: python test_google_jobs_api.py")
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Set up the Google Jobs API integration")
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--continue-on-error", dest="continue_on_error", action="store_true",
+                       default=None, help="keep going after a required step fails, without asking")
+    group.add_argument("--stop-on-error", dest="continue_on_error", action="store_false",
+                       help="stop after a required step fails, without asking")
+    args = parser.parse_args()
+    main(continue_on_error=args.continue_on_error)
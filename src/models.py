@@ -2,10 +2,12 @@
 Database models for AI Job Application Agent
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, Index, func
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.dialects.postgresql import JSONB
 from datetime import datetime
 from config import Config
 
@@ -194,10 +196,10 @@ class WebsiteConfiguration(Base):
     login_required = Column(Boolean, default=False)
     login_url = Column(String(500))
     
-    # CSS/XPath selectors stored as JSON
-    search_selectors = Column(Text)  # JSON: {"keywords": "#search-input", "location": "#location-input"}
-    job_selectors = Column(Text)     # JSON: {"job_title": ".job-title", "company": ".company-name"}
-    form_selectors = Column(Text)    # JSON: {"apply_button": ".apply-btn", "resume_upload": "input[type='file']"}
+    # CSS/XPath selectors stored as JSONB
+    search_selectors = Column(JSONB)  # {"keywords": "#search-input", "location": "#location-input"}
+    job_selectors = Column(JSONB)     # {"job_title": ".job-title", "company": ".company-name"}
+    form_selectors = Column(JSONB)    # {"apply_button": ".apply-btn", "resume_upload": "input[type='file']"}
     
     # Pagination and scraping settings
     pagination_selector = Column(String(255))
@@ -209,6 +211,11 @@ class WebsiteConfiguration(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow)
 
+    __table_args__ = (
+        # Names are unique case-insensitively; also the ON CONFLICT target for inserts
+        Index("idx_website_configurations_lower_name", func.lower(name), unique=True),
+    )
+
 
 class ApplicationLog(Base):
     """Model for detailed application logs"""
@@ -358,3 +365,23 @@ def get_job_db():
         yield db
     finally:
         db.close()
+
+# Async engine for handlers that must not block the event loop. It is created
+# once and shared so its connection pool is reused across requests.
+_async_session_factory = None
+
+def get_async_session_factory():
+    global _async_session_factory
+    if _async_session_factory is None:
+        # psycopg 3 provides the asyncio driver for the same DATABASE_URL
+        url = make_url(config.DATABASE_URL).set(drivername="postgresql+psycopg")
+        engine = create_async_engine(url, pool_pre_ping=True)
+        _async_session_factory = async_sessionmaker(
+            engine, class_=AsyncSession, expire_on_commit=False
+        )
+    return _async_session_factory
+
+async def get_async_job_db():
+    """Get async database session for job operations"""
+    async with get_async_session_factory()() as db:
+        yield db
@@ -5,6 +5,7 @@ No external dependencies - creates realistic mock jobs
 
 import asyncio
 import random
+import sys
 from typing import List, Dict
 from datetime import datetime
 
@@ -121,13 +122,17 @@ async def test_simple_generator():
     async with SimpleJobGenerator() as generator:
         jobs = await generator.search_jobs("python developer", "Remote", 10)
         
-        print(f"\nFound {len(jobs)} jobs:")
+        # Build the whole report and write it at once rather than line by line
+        parts = [f"\nFound {len(jobs)} jobs:\n"]
         for i, job in enumerate(jobs, 1):
-            print(f"\n{i}. {job.get('title', 'N/A')}")
-            print(f"   Company: {job.get('company', 'N/A')}")
-            print(f"   Location: {job.get('location', 'N/A')}")
-            print(f"   Salary: {job.get('salary', 'N/A')}")
-            print(f"   Posted: {job.get('posted_date', 'N/A')}")
+            parts.append(
+                f"\n{i}. {job.get('title', 'N/A')}\n"
+                f"   Company: {job.get('company', 'N/A')}\n"
+                f"   Location: {job.get('location', 'N/A')}\n"
+                f"   Salary: {job.get('salary', 'N/A')}\n"
+                f"   Posted: {job.get('posted_date', 'N/A')}\n"
+            )
+        sys.stdout.write("".join(parts))
 
 if __name__ == "__main__":
     asyncio.run(test_simple_generator())
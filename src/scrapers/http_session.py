@@ -0,0 +1,30 @@
+"""
+Shared HTTP session for the job scrapers and RSS fetchers
+"""
+
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_shared_session() -> requests.Session:
+    """Return the process-wide session, creating it on first use
+
+    Fetchers are created per search, so sharing one session keeps pooled
+    connections (and their TLS handshakes) alive between searches. Requests
+    run in worker threads, so the pool is sized for concurrent feeds.
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _session = session
+    return _session
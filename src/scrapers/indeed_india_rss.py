@@ -2,7 +2,6 @@
 Indeed India RSS Job Fetcher - Using Requests
 """
 
-import requests
 import feedparser
 import asyncio
 from typing import List, Dict
@@ -10,21 +9,23 @@ from datetime import datetime
 import urllib.parse
 import time
 
+from .http_session import get_shared_session
+
 class IndeedIndiaRSSFetcher:
     def __init__(self):
         self.base_rss_url = "https://in.indeed.com/rss"
-        self.session = requests.Session()
+        self.session = get_shared_session()
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
             'Accept': 'application/rss+xml, application/xml, text/xml'
         }
-        self.session.headers.update(self.headers)
     
     async def __aenter__(self):
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        self.session.close()
+        # The session is shared with other fetchers, so it stays open
+        pass
     
     async def search_jobs(self, keywords: str, location: str = "Delhi", limit: int = 50) -> List[Dict]:
         """Fetch jobs from Indeed India RSS feeds"""
@@ -42,9 +43,14 @@ class IndeedIndiaRSSFetcher:
             rss_url = f"{self.base_rss_url}?{urllib.parse.urlencode(params)}"
             print(f"Fetching from Indeed RSS: {rss_url}")
             
-            response = self.session.get(rss_url, timeout=30)
+            # Blocking request runs in a worker thread so concurrent sources
+            # gathered by the aggregator actually overlap
+            response = await asyncio.to_thread(
+                self.session.get, rss_url, headers=self.headers, timeout=30
+            )
             if response.status_code == 200:
-                jobs = self._parse_rss_feed(response.text, keywords)
+                # feedparser is a blocking parse; keep it off the event loop too
+                jobs = await asyncio.to_thread(self._parse_rss_feed, response.text, keywords)
             else:
                 print(f"Indeed RSS request failed: {response.status_code}")
                 return []
@@ -8,6 +8,10 @@ from typing import List, Dict
 from datetime import datetime
 import random
 
+# Upper bound on one source's search, so a stalled source can't hold up the
+# whole aggregated search
+SOURCE_TIMEOUT = 90  # seconds
+
 class IndianJobAggregator:
     def __init__(self):
         self.sources_available = []
@@ -73,18 +77,25 @@ class IndianJobAggregator:
     async def _search_single_source(self, source_name: str, source_class, keywords: str, location: str, limit: int) -> List[Dict]:
         """Search jobs from a single source"""
         try:
-            if source_name == 'indeed_multi':
-                # Special handling for multi-location Indeed
-                fetcher = source_class()
-                jobs = await fetcher.search_jobs_multiple_cities(keywords, limit)
-            else:
-                async with source_class() as scraper:
-                    jobs = await scraper.search_jobs(keywords, location, limit)
+            # wait_for raises TimeoutError both when the deadline passes and
+            # when the source itself times out (e.g. a socket timeout), so the
+            # deadline is told apart by the task having been cancelled
+            fetch = asyncio.ensure_future(
+                self._fetch_from_source(source_name, source_class, keywords, location, limit)
+            )
+            try:
+                jobs = await asyncio.wait_for(fetch, timeout=SOURCE_TIMEOUT)
+            except asyncio.TimeoutError:
+                if fetch.cancelled():
+                    print(f"{source_name} timed out after {SOURCE_TIMEOUT}s")
+                    return []
+                raise
             
-            # Add source identifier
+            # Add source identifier; one timestamp covers the whole batch
+            scraped_at = datetime.utcnow().isoformat()
             for job in jobs:
                 job['aggregator_source'] = source_name
-                job['scraped_at'] = datetime.utcnow().isoformat()
+                job['scraped_at'] = scraped_at
             
             return jobs
             
@@ -92,6 +103,16 @@ class IndianJobAggregator:
             print(f"Error in {source_name}: {str(e)}")
             return []
     
+    async def _fetch_from_source(self, source_name: str, source_class, keywords: str, location: str, limit: int) -> List[Dict]:
+        """Run a single source's search"""
+        if source_name == 'indeed_multi':
+            # Special handling for multi-location Indeed
+            fetcher = source_class()
+            return await fetcher.search_jobs_multiple_cities(keywords, limit)
+        
+        async with source_class() as scraper:
+            return await scraper.search_jobs(keywords, location, limit)
+    
     def _deduplicate_jobs(self, jobs: List[Dict]) -> List[Dict]:
         """Remove duplicate jobs based on URL and title+company"""
         unique_jobs = []
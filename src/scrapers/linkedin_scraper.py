@@ -3,6 +3,7 @@ LinkedIn Job Scraper using Playwright
 """
 
 import asyncio
+import os
 import random
 from typing import List, Dict, Optional
 from playwright.async_api import async_playwright, Page, Browser
@@ -31,6 +32,9 @@ class LinkedInJobScraper:
                 headless=headless,
                 args=[
                     '--no-sandbox',
+                    '--disable-gpu',
+                    '--disable-dev-shm-usage',
+                    '--disable-extensions',
                     '--disable-blink-features=AutomationControlled',
                     '--disable-features=VizDisplayCompositor',
                     '--disable-web-security',
@@ -449,12 +453,15 @@ class LinkedInJobScraper:
         await self.close_browser()
 
 # Usage example and testing
+# Set SCRAPER_HEADFUL=1 to watch the browser while the test runs
+HEADLESS = os.environ.get("SCRAPER_HEADFUL") != "1"
+
 async def test_linkedin_scraper():
     """Test the LinkedIn scraper"""
     scraper = LinkedInJobScraper()
     
     try:
-        await scraper.start_browser(headless=False)  # Set to True for production
+        await scraper.start_browser(headless=HEADLESS)
         
         jobs = await scraper.search_jobs(
             keywords="python developer",
@@ -3,18 +3,30 @@ Real Naukri.com Job Scraper for Indian Jobs - Using Requests
 """
 
 import asyncio
-import requests
 import json
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from typing import List, Dict
 from datetime import datetime
 import random
 import time
 
+from .http_session import get_shared_session
+
+# lxml's C parser builds the tree several times faster than html.parser
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# Only job cards are read, so only their subtrees are built when parsing
+JOB_CARD_STRAINER = SoupStrainer('div', class_=['row', 'jobTuple'])
+
 class NaukriJobScraper:
     def __init__(self):
         self.base_url = "https://www.naukri.com"
-        self.session = requests.Session()
+        self.search_url = f"{self.base_url}/jobs-search"
+        self.session = get_shared_session()
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
@@ -28,21 +40,19 @@ class NaukriJobScraper:
             'Sec-Fetch-User': '?1',
             'Cache-Control': 'max-age=0'
         }
-        self.session.headers.update(self.headers)
     
     async def __aenter__(self):
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        self.session.close()
+        # The session is shared with other fetchers, so it stays open
+        pass
     
     async def search_jobs(self, keywords: str, location: str = "Delhi", limit: int = 50) -> List[Dict]:
         """Search jobs on Naukri.com"""
         try:
             jobs = []
             
-            # Build search URL
-            search_url = f"{self.base_url}/jobs-search"
             params = {
                 'q': keywords,
                 'l': location,
@@ -60,9 +70,16 @@ class NaukriJobScraper:
                 params['start'] = page * 20
                 
                 try:
-                    response = self.session.get(search_url, params=params, timeout=30)
+                    # Request and parse in worker threads so concurrent searches
+                    # (e.g. gathered by the aggregator) don't block each other
+                    response = await asyncio.to_thread(
+                        self.session.get, self.search_url, params=dict(params),
+                        headers=self.headers, timeout=30
+                    )
                     if response.status_code == 200:
-                        page_jobs = self._parse_job_listings(response.text, keywords)
+                        page_jobs = await asyncio.to_thread(
+                            self._parse_job_listings, response.text, keywords
+                        )
                         jobs.extend(page_jobs)
                         
                         if len(jobs) >= limit:
@@ -90,7 +107,7 @@ class NaukriJobScraper:
         jobs = []
         
         try:
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = BeautifulSoup(html, HTML_PARSER, parse_only=JOB_CARD_STRAINER)
             job_cards = soup.find_all('div', class_=['row', 'jobTuple'])
             
             for card in job_cards:
@@ -5,7 +5,8 @@ Works offline - generates realistic Indian job postings for testing
 
 import asyncio
 import random
-from typing import List, Dict
+import sys
+from typing import List, Dict, Tuple
 from datetime import datetime, timedelta
 
 class ReliableIndianJobGenerator:
@@ -161,6 +162,9 @@ class ReliableIndianJobGenerator:
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         pass
 
+# Sources searched at the same time by MultiSourceIndianJobFetcher
+MAX_CONCURRENT_SOURCES = 4
+
 # Multiple Indian job sources that work reliably
 class MultiSourceIndianJobFetcher:
     def __init__(self):
@@ -172,27 +176,54 @@ class MultiSourceIndianJobFetcher:
     
     async def search_all_sources(self, keywords: str, location: str = "Delhi", limit: int = 100) -> List[Dict]:
         """Fetch jobs from multiple reliable sources"""
-        all_jobs = []
         jobs_per_source = max(20, limit // len(self.sources))
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_SOURCES)
         
-        for source_name, source_instance in self.sources:
+        async def search_source(index, source_name, source_instance) -> Tuple[int, List[Dict]]:
             try:
-                async with source_instance as fetcher:
-                    source_jobs = await fetcher.search_jobs(keywords, location, jobs_per_source)
-                    
-                    # Add source identifier
-                    for job in source_jobs:
-                        job['aggregator_source'] = source_name
-                        job['scraped_at'] = datetime.utcnow().isoformat()
-                    
-                    all_jobs.extend(source_jobs)
-                    
-                    if len(all_jobs) >= limit:
-                        break
+                async with semaphore:
+                    async with source_instance as fetcher:
+                        source_jobs = await fetcher.search_jobs(keywords, location, jobs_per_source)
+                
+                # Add source identifier
+                scraped_at = datetime.utcnow().isoformat()
+                for job in source_jobs:
+                    job['aggregator_source'] = source_name
+                    job['scraped_at'] = scraped_at
+                
+                return index, source_jobs
             
             except Exception as e:
                 print(f"Error from {source_name}: {str(e)}")
-                continue
+                return index, []
+        
+        # Search sources concurrently and collect them as they finish; once
+        # enough jobs are in, the sources still running are cancelled
+        tasks = [
+            asyncio.create_task(search_source(index, source_name, source_instance))
+            for index, (source_name, source_instance) in enumerate(self.sources)
+        ]
+        jobs_by_source = {}
+        found = 0
+        try:
+            for finished in asyncio.as_completed(tasks):
+                index, source_jobs = await finished
+                jobs_by_source[index] = source_jobs
+                found += len(source_jobs)
+                
+                if found >= limit:
+                    break
+        finally:
+            for task in tasks:
+                task.cancel()
+            # Wait for the cancelled sources so none is left pending
+            await asyncio.gather(*tasks, return_exceptions=True)
+        
+        # Keep source order, whichever finished first, so deduplication keeps
+        # the same copy of a job from run to run
+        all_jobs = [
+            job for index in sorted(jobs_by_source) for job in jobs_by_source[index]
+        ]
         
         # Remove duplicates and return
         unique_jobs = self._deduplicate_jobs(all_jobs)
@@ -217,15 +248,19 @@ async def test_reliable_generator():
     async with ReliableIndianJobGenerator() as generator:
         jobs = await generator.search_jobs("python developer", "Delhi", 15)
         
-        print(f"\n✅ Found {len(jobs)} reliable Indian jobs:")
+        # Build the whole report and write it at once rather than line by line
+        parts = [f"\n✅ Found {len(jobs)} reliable Indian jobs:\n"]
         for i, job in enumerate(jobs[:5], 1):
-            print(f"{i}. {job['title']}")
-            print(f"   Company: {job['company']}")
-            print(f"   Location: {job['location']}")
-            print(f"   Salary: {job['salary']}")
-            print(f"   Experience: {job['experience']}")
-            print(f"   Posted: {job['posted_date']}")
-            print()
+            parts.append(
+                f"{i}. {job['title']}\n"
+                f"   Company: {job['company']}\n"
+                f"   Location: {job['location']}\n"
+                f"   Salary: {job['salary']}\n"
+                f"   Experience: {job['experience']}\n"
+                f"   Posted: {job['posted_date']}\n"
+                "\n"
+            )
+        sys.stdout.write("".join(parts))
 
 if __name__ == "__main__":
     asyncio.run(test_reliable_generator())
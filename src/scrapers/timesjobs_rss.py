@@ -2,7 +2,6 @@
 TimesJobs RSS Feed Fetcher - Using Requests Only
 """
 
-import requests
 import feedparser
 import asyncio
 from typing import List, Dict
@@ -11,6 +10,8 @@ import urllib.parse
 import re
 import time
 
+from .http_session import get_shared_session
+
 class TimesJobsRSSFetcher:
     def __init__(self):
         self.rss_urls = [
@@ -18,39 +19,46 @@ class TimesJobsRSSFetcher:
             "https://www.timesjobs.com/rss/jobs-by-skills-rss.xml",
             "https://www.timesjobs.com/rss/jobs-by-location-rss.xml"
         ]
-        self.session = requests.Session()
+        self.session = get_shared_session()
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
             'Accept': 'application/rss+xml, application/xml, text/xml'
         }
-        self.session.headers.update(self.headers)
     
     async def __aenter__(self):
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        self.session.close()
+        # The session is shared with other fetchers, so it stays open
+        pass
     
     async def search_jobs(self, keywords: str, location: str = "Delhi", limit: int = 50) -> List[Dict]:
         """Fetch jobs from TimesJobs RSS feeds"""
         try:
             all_jobs = []
             
-            # Fetch from multiple RSS feeds
-            for rss_url in self.rss_urls:
-                try:
-                    response = self.session.get(rss_url, timeout=30)
-                    if response.status_code == 200:
-                        jobs = self._parse_rss_feed(response.text, keywords, location)
-                        all_jobs.extend(jobs)
-                    else:
-                        print(f"TimesJobs RSS failed: {response.status_code} for {rss_url}")
-                    
-                    await asyncio.sleep(2)  # Rate limiting
-                    
-                except Exception as e:
-                    print(f"Error fetching TimesJobs RSS {rss_url}: {str(e)}")
+            # Fetch all RSS feeds at once; each blocking request runs in a
+            # worker thread so the event loop stays free
+            fetches = [
+                asyncio.to_thread(
+                    self.session.get, rss_url, headers=self.headers, timeout=30
+                )
+                for rss_url in self.rss_urls
+            ]
+            responses = await asyncio.gather(*fetches, return_exceptions=True)
+            
+            for rss_url, response in zip(self.rss_urls, responses):
+                if isinstance(response, Exception):
+                    print(f"Error fetching TimesJobs RSS {rss_url}: {str(response)}")
                     continue
+                
+                if response.status_code == 200:
+                    jobs = await asyncio.to_thread(
+                        self._parse_rss_feed, response.text, keywords, location
+                    )
+                    all_jobs.extend(jobs)
+                else:
+                    print(f"TimesJobs RSS failed: {response.status_code} for {rss_url}")
             
             # Filter and deduplicate
             filtered_jobs = self._filter_jobs(all_jobs, keywords, location)
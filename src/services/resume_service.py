@@ -8,7 +8,12 @@ import re
 import io
 from datetime import datetime
 import base64
+import functools
 import json
+import logging
+import os
+
+logger = logging.getLogger(__name__)
 
 # Handle PDF/DOCX imports gracefully
 try:
@@ -34,24 +39,146 @@ except ImportError:
 
 # Handle OpenAI import gracefully
 try:
-    import openai
+    from openai import AsyncOpenAI
 
     OPENAI_AVAILABLE = True
 except ImportError:
     OPENAI_AVAILABLE = False
-    print("Warning: OpenAI not available. Using fallback methods.")
+    logger.warning("OpenAI not available. Using fallback methods.")
+
+# Prefer RE2's linear-time engine for the patterns compiled through _re (contact,
+# experience and the skills alternation); none of those use backreferences or
+# lookaround, so the stdlib engine is a drop-in fallback. The skills-section,
+# per-skill and title patterns use lookaround, which RE2 lacks, and stay on re
+try:
+    import re2 as _re
+except ImportError:
+    _re = re
+
+_EMAIL_PATTERNS = tuple(
+    _re.compile(pattern)
+    for pattern in [
+        r"(?i)Email:\s*([A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,})",
+        r"(?i)E-mail:\s*([A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,})",
+        r"(?i)\b([A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,})\b",
+    ]
+)
+_PHONE_PATTERNS = tuple(
+    _re.compile(pattern)
+    for pattern in [
+        r"(?i)Phone:\s*([\+]?[\d\s\-\(\)\.]{7,15})",
+        r"(?i)Mobile:\s*([\+]?[\d\s\-\(\)\.]{7,15})",
+        r"(?i)Tel:\s*([\+]?[\d\s\-\(\)\.]{7,15})",
+        r"\b(\d{10})\b",  # 10 digit numbers
+        r"\b(\+?\d{1,3}[-.]?\s?\(?\d{3,4}\)?[-.]?\s?\d{3,4}[-.]?\s?\d{3,4})\b",
+    ]
+)
+_LINKEDIN_PATTERNS = tuple(
+    _re.compile(pattern)
+    for pattern in [
+        r"(?i)(linkedin\.com/in/[\w\-]+)",
+        r"(?i)(www\.linkedin\.com/in/[\w\-]+)",
+        r"(?i)(https?://(?:www\.)?linkedin\.com/in/[\w\-]+)",
+    ]
+)
+# "N years of experience/in/with/working/as" phrases, which start at the number
+_EXPERIENCE_RE = _re.compile(
+    r"(?i)(\d+)\+?\s*years?\s+(?:(?:of\s+)?experience|in|with|working|as)"
+)
+# "experience ... N years" and "with N years" are scanned separately, since a
+# match of the pattern above can consume the word these start with
+_EXPERIENCE_CONTEXT_RE = _re.compile(
+    r"(?i)experience.*?(\d+)\+?\s*years?|with\s+(\d+)\+?\s*years?"
+)
+_PHONE_STRIP_RE = _re.compile(r"[^\d\+]")
+
+# Text cleanup patterns
+_CONTROL_CHARS_RE = re.compile(r"[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]")
+_HORIZONTAL_WS_RE = re.compile(r"[^\S\n]+")
+_LINE_BREAKS_RE = re.compile(r"\s*\n\s*")
+_PLAIN_LINE_RE = re.compile(r"^[A-Za-z0-9\s\.,;:!?\-()]+$")
+_WORD_RE = re.compile(r"[a-zA-Z]{3,}")
+
+# Name candidates: 2-4 alphabetic words of at least two letters each
+_NAME_LINE_RE = re.compile(r"^[^\W\d_]{2,}(?:\s+[^\W\d_]{2,}){1,3}$")
+_NAME_STOPWORDS_RE = re.compile(r"phone|email|location|address|professional|summary")
+_NON_WORD_RE = re.compile(r"[^\w\s]")
+
+# Job titles looked for in the professional summary, as one alternation
+_TITLE_RE = re.compile(
+    r"\b(?:full[\- ]stack|frontend|backend|software|web|senior|junior|lead)"
+    r" developer\b|\bsoftware engineer\b|\bdata (?:analyst|scientist)\b"
+    r"|\bproject manager\b",
+    re.IGNORECASE,
+)
+_SENTENCE_SPLIT_RE = re.compile(r"[.!?]")
+_TITLE_FALLBACK_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in [
+        r"(Full Stack Developer.*?)(?=\s*\n|\s*\|)",
+        r"(.*?Developer.*?)(?=\s*\n|\s*\|)",
+        r"(.*?Engineer.*?)(?=\s*\n|\s*\|)",
+    ]
+)
+
+
+@functools.lru_cache(maxsize=4)
+def _build_skills_regex(skills_lower: tuple) -> "re.Pattern":
+    """Compile a word-bounded alternation of lowercased skills"""
+    # Longest first so "react native" wins over "react" at the same position
+    alternation = "|".join(
+        _re.escape(skill) for skill in sorted(skills_lower, key=len, reverse=True)
+    )
+    return _re.compile(rf"\b(?:{alternation})\b")
+
+
+# Prompt for AI resume extraction, kept unindented so no whitespace is sent as tokens
+_AI_EXTRACTION_PROMPT = """\
+Extract the following information from this resume text and return ONLY a valid JSON object:
+
+{{
+    "name": "Full name of the person",
+    "email": "Email address",
+    "phone": "Phone number (clean format)",
+    "currentTitle": "Current job title or most recent position",
+    "experienceYears": number_of_years_experience,
+    "skills": ["comprehensive list of technical skills"],
+    "linkedinUrl": "LinkedIn URL if found",
+    "education": [
+        {{
+            "degree": "Degree name",
+            "field_of_study": "Field of study",
+            "institution": "Institution name",
+            "graduation_year": "Year",
+            "gpa": "GPA if available"
+        }}
+    ]
+}}
+
+Resume text:
+{text}
+
+Rules:
+- Return ONLY the JSON object, no other text
+- Extract ALL technical skills mentioned
+- Include education information if available
+- If a field is not found, use empty string "" or empty array []
+- For experienceYears, calculate from work history
+
+Return ONLY the JSON object:
+"""
 
 
 class ResumeService:
     def __init__(self):
-        self.email_pattern = re.compile(
+        self.email_pattern = _re.compile(
             r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"
         )
-        self.phone_pattern = re.compile(
+        self.phone_pattern = _re.compile(
             r"(?:\+?\d{1,3}[-.\s]?)?(?:\(?\d{3}\)?[-.\s]?)?[\d\s\-\.]{7,14}"
         )
-        self.linkedin_pattern = re.compile(r"linkedin\.com/in/[\w\-]+", re.IGNORECASE)
-        self.github_pattern = re.compile(r"github\.com/[\w\-]+", re.IGNORECASE)
+        self.linkedin_pattern = _re.compile(r"(?i)linkedin\.com/in/[\w\-]+")
+        self.github_pattern = _re.compile(r"(?i)github\.com/[\w\-]+")
 
         # Enhanced technical skills list
         self.technical_skills = [
@@ -188,6 +315,12 @@ class ResumeService:
             "LDAP",
         ]
 
+        # Parallel tuples of original and lowercased skills for the matching loops
+        self._skills_original = tuple(self.technical_skills)
+        self._skills_lower = tuple(skill.lower() for skill in self.technical_skills)
+        self._skills_by_lower = dict(zip(self._skills_lower, self._skills_original))
+        self._skills_re = _build_skills_regex(self._skills_lower)
+
         # Education degree patterns
         self.degree_patterns = [
             r"(Bachelor|B\.?[ASE]\.?|B\.?Tech|B\.?Sc\.?|B\.?Com\.?|B\.?A\.?)\s*(?:of|in|degree)?\s*([^,\n\r]+)",
@@ -197,6 +330,9 @@ class ResumeService:
             r"(Diploma|Certificate)\s*(?:in|of)?\s*([^,\n\r]+)",
         ]
 
+        # OpenAI client is created on first use and reused for every call
+        self._openai_client = None
+
     async def parse_resume(
         self, file_content: bytes, filename: str, content_type: str
     ) -> dict:
@@ -229,18 +365,17 @@ class ResumeService:
                     "extractedData": {},
                 }
 
-            print(f"Successfully extracted {len(text)} characters of text")
-            print(f"Text sample: {text[:300]}...")
+            logger.debug("Successfully extracted %s characters of text", len(text))
 
             # Try AI parsing first for better accuracy
-            print("Attempting AI parsing for resume extraction...")
+            logger.debug("Attempting AI parsing for resume extraction...")
             ai_extracted = await self._extract_with_ai(text)
 
             if ai_extracted and ai_extracted.get("name"):
                 extracted_data = ai_extracted
-                print("AI extraction successful")
+                logger.debug("AI extraction successful")
             else:
-                print("AI extraction failed, using enhanced regex extraction")
+                logger.debug("AI extraction failed, using enhanced regex extraction")
                 # Extract information using enhanced regex patterns as fallback
                 extracted_data = await self._extract_information(text)
 
@@ -252,10 +387,7 @@ class ResumeService:
             }
 
         except Exception as e:
-            print(f"Error processing resume: {e}")
-            import traceback
-
-            traceback.print_exc()
+            logger.exception("Error processing resume: %s", e)
             return {
                 "success": False,
                 "error": f"Error processing resume: {str(e)}",
@@ -264,12 +396,20 @@ class ResumeService:
 
     async def _extract_pdf_text(self, file_content: bytes) -> str:
         """Extract text from PDF file using multiple methods"""
+        # Uploads labelled as PDF without a PDF header would only fail in both
+        # libraries below; decode them once as plain text instead
+        if b"%PDF-" not in file_content[:1024]:
+            logger.debug("No PDF header found, reading content as plain text")
+            return self._clean_extracted_text(
+                file_content.decode("utf-8", errors="ignore")
+            )
+
         text = ""
 
         # Method 1: Try PyMuPDF (most reliable for complex PDFs)
         if PYMUPDF_AVAILABLE:
             try:
-                print("Trying PyMuPDF extraction...")
+                logger.debug("Trying PyMuPDF extraction...")
                 doc = fitz.open("pdf", file_content)
                 for page_num in range(doc.page_count):
                     page = doc[page_num]
@@ -279,15 +419,17 @@ class ResumeService:
                 doc.close()
 
                 if text.strip() and not text.startswith("%PDF"):
-                    print(f"PyMuPDF successfully extracted {len(text)} characters")
+                    logger.debug(
+                        "PyMuPDF successfully extracted %s characters", len(text)
+                    )
                     return self._clean_extracted_text(text)
             except Exception as e:
-                print(f"PyMuPDF extraction failed: {e}")
+                logger.warning("PyMuPDF extraction failed: %s", e)
 
         # Method 2: Try PyPDF2 with enhanced extraction
         if PDF_AVAILABLE:
             try:
-                print("Trying PyPDF2 extraction...")
+                logger.debug("Trying PyPDF2 extraction...")
                 pdf_file = io.BytesIO(file_content)
                 pdf_reader = PyPDF2.PdfReader(pdf_file)
 
@@ -297,16 +439,18 @@ class ResumeService:
                         if page_text and page_text.strip():
                             text += page_text + "\n"
                     except Exception as e:
-                        print(f"Error extracting page {page_num}: {e}")
+                        logger.warning("Error extracting page %s: %s", page_num, e)
                         continue
 
                 if text.strip() and not text.startswith("%PDF"):
-                    print(f"PyPDF2 successfully extracted {len(text)} characters")
+                    logger.debug(
+                        "PyPDF2 successfully extracted %s characters", len(text)
+                    )
                     return self._clean_extracted_text(text)
             except Exception as e:
-                print(f"PyPDF2 extraction failed: {e}")
+                logger.warning("PyPDF2 extraction failed: %s", e)
 
-        print("All PDF extraction methods failed or returned binary data")
+        logger.warning("All PDF extraction methods failed or returned binary data")
         return ""
 
     def _clean_extracted_text(self, text: str) -> str:
@@ -319,7 +463,7 @@ class ResumeService:
 
         # Remove PDF artifacts and binary data
         if text.startswith("%PDF") or "endobj" in text[:100]:
-            print("Detected PDF binary data, cleaning...")
+            logger.debug("Detected PDF binary data, cleaning...")
             # Try to extract readable text from PDF artifacts
             lines = text.split("\n")
             clean_lines = []
@@ -332,26 +476,29 @@ class ResumeService:
                     continue
                 # Keep lines that look like text content
                 if (
-                    re.match(r"^[A-Za-z0-9\s\.,;:!?\-()]+$", line.strip())
+                    _PLAIN_LINE_RE.match(line.strip())
                     and len(line.strip()) > 2
                 ):
                     clean_lines.append(line.strip())
             text = "\n".join(clean_lines)
 
-        # Remove excessive whitespace and invisible characters
-        text = re.sub(
-            r"[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]", " ", text
-        )  # Remove control characters
-        text = re.sub(r"\s+", " ", text)  # Normalize whitespace
-        text = re.sub(r"\n\s*\n+", "\n", text)  # Remove empty lines
+        # Remove excessive whitespace and invisible characters, keeping the line
+        # breaks that name and title detection rely on
+        text = _CONTROL_CHARS_RE.sub(" ", text)  # Remove control characters
+        text = _HORIZONTAL_WS_RE.sub(" ", text)  # Normalize whitespace within lines
+        text = _LINE_BREAKS_RE.sub("\n", text)  # Remove empty lines
 
         # Validate that we have meaningful text content
-        if len(text.strip()) < 50 or not re.search(r"[a-zA-Z]{3,}", text):
-            print("Cleaned text appears to be insufficient or corrupted")
+        if len(text.strip()) < 50 or not _WORD_RE.search(text):
+            logger.warning("Cleaned text appears to be insufficient or corrupted")
             return ""
 
-        print(f"Cleaned text length: {len(text)} characters")
-        print(f"First 200 chars: {text[:200]}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Cleaned text length: %d characters, first 200 chars: %s",
+                len(text),
+                text[:200],
+            )
 
         return text.strip()
 
@@ -366,30 +513,54 @@ class ResumeService:
                     text += paragraph.text.strip() + "\n"
             return self._clean_extracted_text(text)
         except Exception as e:
-            print(f"DOCX extraction error: {e}")
+            logger.warning("DOCX extraction error: %s", e)
             return ""
 
     async def _extract_information(self, text: str) -> dict:
         """Extract structured information from resume text using enhanced patterns"""
 
-        # Extract basic information
-        name = self._extract_name(text)
-        email = self._extract_email(text)
-        phone = self._extract_phone(text)
-        linkedin_url = self._extract_linkedin(text)
-        skills = self._extract_skills(text)
-        experience_years = self._extract_experience_years(text)
-        current_title = self._extract_current_title(text)
-        education = self._extract_education(text)
-
-        print(f"Enhanced Extraction Results:")
-        print(f"Name: '{name}'")
-        print(f"Email: '{email}'")
-        print(f"Phone: '{phone}'")
-        print(f"Title: '{current_title}'")
-        print(f"Experience: {experience_years} years")
-        print(f"Skills: {len(skills)} found - {skills[:5]}...")
-        print(f"Education: {len(education)} entries")
+        # Lowercase the text and split it into lines once, shared by the extractors
+        text_lower = text.lower()
+        clean_lines = [line.strip() for line in text.split("\n") if line.strip()]
+        clean_lines_lower = [line.lower() for line in clean_lines]
+
+        # The extractors are independent, so run them in worker threads to keep
+        # the event loop free for other requests while the regexes run
+        (
+            name,
+            email,
+            phone,
+            linkedin_url,
+            skills,
+            experience_years,
+            current_title,
+            education,
+        ) = await asyncio.gather(
+            asyncio.to_thread(self._extract_name, text, clean_lines, clean_lines_lower),
+            asyncio.to_thread(self._extract_email, text),
+            asyncio.to_thread(self._extract_phone, text),
+            asyncio.to_thread(self._extract_linkedin, text),
+            asyncio.to_thread(self._extract_skills, text, text_lower),
+            asyncio.to_thread(self._extract_experience_years, text),
+            asyncio.to_thread(
+                self._extract_current_title, text, clean_lines, clean_lines_lower
+            ),
+            asyncio.to_thread(self._extract_education, text),
+        )
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Enhanced extraction results: name=%r email=%r phone=%r title=%r "
+                "experience=%s years, %d skills %s..., %d education entries",
+                name,
+                email,
+                phone,
+                current_title,
+                experience_years,
+                len(skills),
+                skills[:5],
+                len(education),
+            )
 
         return {
             "name": name,
@@ -402,15 +573,16 @@ class ResumeService:
             "education": education,
         }
 
-    def _extract_name(self, text: str) -> str:
+    def _extract_name(
+        self, text: str, lines: List[str], lines_lower: List[str]
+    ) -> str:
         """Extract name using multiple strategies"""
-        lines = [line.strip() for line in text.split("\n") if line.strip()]
 
         # Strategy 1: Look for name at the very beginning
         if lines:
             first_line = lines[0].strip()
             # Clean the first line and check for all caps name like "CHANNU PRAVEEN KUMAR"
-            clean_first = re.sub(r"[^\w\s]", " ", first_line).strip()
+            clean_first = _NON_WORD_RE.sub(" ", first_line).strip()
             words = clean_first.split()
 
             # Check for all caps name (your resume format)
@@ -444,23 +616,12 @@ class ResumeService:
                     return candidate
 
         # Strategy 3: Look in first few lines for valid names
-        for line in lines[:3]:
-            clean_line = re.sub(r"[^\w\s]", " ", line).strip()
+        for line, line_lower in zip(lines[:3], lines_lower[:3]):
+            clean_line = _NON_WORD_RE.sub(" ", line).strip()
             if (
-                clean_line
-                and not any(
-                    keyword in clean_line.lower()
-                    for keyword in [
-                        "phone",
-                        "email",
-                        "location",
-                        "address",
-                        "professional",
-                        "summary",
-                    ]
-                )
-                and 2 <= len(clean_line.split()) <= 4
-                and self._is_valid_name(clean_line)
+                6 <= len(clean_line) <= 50
+                and _NAME_LINE_RE.match(clean_line)
+                and not _NAME_STOPWORDS_RE.search(line_lower)
             ):
                 return clean_line
 
@@ -484,48 +645,27 @@ class ResumeService:
 
     def _extract_email(self, text: str) -> str:
         """Extract email address with enhanced patterns"""
-        # Enhanced email pattern
-        email_patterns = [
-            r"Email:\s*([A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,})",
-            r"E-mail:\s*([A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,})",
-            r"\b([A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,})\b",
-        ]
-
-        for pattern in email_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+        for pattern in _EMAIL_PATTERNS:
+            matches = pattern.findall(text)
             if matches:
                 return matches[0]
         return ""
 
     def _extract_phone(self, text: str) -> str:
         """Extract phone number with enhanced patterns"""
-        phone_patterns = [
-            r"Phone:\s*([\+]?[\d\s\-\(\)\.]{7,15})",
-            r"Mobile:\s*([\+]?[\d\s\-\(\)\.]{7,15})",
-            r"Tel:\s*([\+]?[\d\s\-\(\)\.]{7,15})",
-            r"\b(\d{10})\b",  # 10 digit numbers
-            r"\b(\+?\d{1,3}[-.]?\s?\(?\d{3,4}\)?[-.]?\s?\d{3,4}[-.]?\s?\d{3,4})\b",
-        ]
-
-        for pattern in phone_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+        for pattern in _PHONE_PATTERNS:
+            matches = pattern.findall(text)
             for match in matches:
                 # Clean and validate phone number
-                clean_phone = re.sub(r"[^\d\+]", "", match)
+                clean_phone = _PHONE_STRIP_RE.sub("", match)
                 if 7 <= len(clean_phone) <= 15:
                     return match.strip()
         return ""
 
     def _extract_linkedin(self, text: str) -> str:
         """Extract LinkedIn URL"""
-        patterns = [
-            r"(linkedin\.com/in/[\w\-]+)",
-            r"(www\.linkedin\.com/in/[\w\-]+)",
-            r"(https?://(?:www\.)?linkedin\.com/in/[\w\-]+)",
-        ]
-
-        for pattern in patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+        for pattern in _LINKEDIN_PATTERNS:
+            matches = pattern.findall(text)
             if matches:
                 url = matches[0]
                 if not url.startswith("http"):
@@ -533,10 +673,9 @@ class ResumeService:
                 return url
         return ""
 
-    def _extract_skills(self, text: str) -> List[str]:
+    def _extract_skills(self, text: str, text_lower: str) -> List[str]:
         """Extract technical skills with improved matching"""
         found_skills = set()
-        text_lower = text.lower()
 
         # Look for skills section first
         skills_section = ""
@@ -555,10 +694,13 @@ class ResumeService:
 
         # If we found a skills section, prioritize it
         search_text = skills_section if skills_section else text_lower
+        search_lower = search_text.lower()
 
         # Match skills with context awareness - more flexible matching
-        for skill in self.technical_skills:
-            skill_lower = skill.lower()
+        for skill, skill_lower in zip(self._skills_original, self._skills_lower):
+            # Every pattern below needs the skill as a literal substring
+            if skill_lower not in search_lower:
+                continue
 
             # Exact matches with word boundaries
             patterns = [
@@ -576,40 +718,25 @@ class ResumeService:
 
         # Also search in the entire text if skills section was limited
         if len(found_skills) < 5:
-            for skill in self.technical_skills:
-                skill_lower = skill.lower()
-                if re.search(rf"\b{re.escape(skill_lower)}\b", text_lower):
-                    found_skills.add(skill)
-
-        # Remove redundant skills (e.g., if both "HTML5" and "HTML" found, keep "HTML5")
-        final_skills = []
-        sorted_skills = sorted(list(found_skills), key=len, reverse=True)
-
-        for skill in sorted_skills:
-            is_redundant = False
-            for existing_skill in final_skills:
-                if skill.lower() in existing_skill.lower() and skill != existing_skill:
-                    is_redundant = True
-                    break
-            if not is_redundant:
-                final_skills.append(skill)
+            for match in self._skills_re.finditer(text_lower):
+                found_skills.add(self._skills_by_lower[match.group(0)])
+
+        # Keep the curated list order. The skills-section pass matches each skill
+        # independently, so "React" and "React Native" can both be reported;
+        # the full-text fallback reports only the longest skill at a position
+        final_skills = [
+            skill for skill in self._skills_original if skill in found_skills
+        ]
 
         return final_skills[:25]  # Return top 25 skills
 
     def _extract_experience_years(self, text: str) -> int:
         """Extract years of experience with improved patterns"""
-        experience_patterns = [
-            r"(\d+)\+?\s*years?\s+(?:of\s+)?experience",
-            r"(\d+)\+?\s*years?\s+(?:in|with|working)",
-            r"experience.*?(\d+)\+?\s*years?",
-            r"(\d+)\+?\s*years?\s+(?:as|working as)",
-            r"with\s+(\d+)\+?\s*years?",
-        ]
-
-        years = []
-        for pattern in experience_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            years.extend([int(match) for match in matches if match.isdigit()])
+        years = [int(match.group(1)) for match in _EXPERIENCE_RE.finditer(text)]
+        years.extend(
+            int(match.group(1) or match.group(2))
+            for match in _EXPERIENCE_CONTEXT_RE.finditer(text)
+        )
 
         if years:
             return max(years)
@@ -625,57 +752,33 @@ class ResumeService:
 
         return 0
 
-    def _extract_current_title(self, text: str) -> str:
+    def _extract_current_title(
+        self, text: str, lines: List[str], lines_lower: List[str]
+    ) -> str:
         """Extract current job title with improved detection"""
-        lines = [line.strip() for line in text.split("\n") if line.strip()]
-
         # Look in professional summary first
         summary_started = False
-        for i, line in enumerate(lines):
-            if "professional summary" in line.lower():
+        for i, (line, line_lower) in enumerate(zip(lines, lines_lower)):
+            if "professional summary" in line_lower:
                 summary_started = True
                 continue
 
             if summary_started and line:
                 # Look for job titles in the summary
-                title_indicators = [
-                    "full stack developer",
-                    "frontend developer",
-                    "backend developer",
-                    "software developer",
-                    "software engineer",
-                    "web developer",
-                    "senior developer",
-                    "junior developer",
-                    "lead developer",
-                    "data analyst",
-                    "data scientist",
-                    "project manager",
-                ]
-
-                line_lower = line.lower()
-                for title in title_indicators:
-                    if title in line_lower:
-                        # Extract the relevant part containing the title
-                        sentences = re.split(r"[.!?]", line)
-                        for sentence in sentences:
-                            if title in sentence.lower():
-                                return sentence.strip()
-                        return line.strip()
+                if _TITLE_RE.search(line_lower):
+                    # Extract the relevant part containing the title
+                    for sentence in _SENTENCE_SPLIT_RE.split(line):
+                        if _TITLE_RE.search(sentence):
+                            return sentence.strip()
+                    return line.strip()
 
                 # Stop after a few lines of summary
                 if i > 5:
                     break
 
         # Look for title patterns in first 10 lines
-        title_patterns = [
-            r"(Full Stack Developer.*?)(?=\s*\n|\s*\|)",
-            r"(.*?Developer.*?)(?=\s*\n|\s*\|)",
-            r"(.*?Engineer.*?)(?=\s*\n|\s*\|)",
-        ]
-
-        for pattern in title_patterns:
-            match = re.search(pattern, text[:1000], re.IGNORECASE)
+        for pattern in _TITLE_FALLBACK_PATTERNS:
+            match = pattern.search(text[:1000])
             if match:
                 title = match.group(1).strip()
                 if len(title.split()) <= 6 and len(title) < 60:
@@ -762,88 +865,57 @@ class ResumeService:
 
         return education_entries[:3]  # Limit to 3 entries to avoid noise
 
+    def _get_openai_client(self) -> Optional["AsyncOpenAI"]:
+        """Return the shared OpenAI client, creating it on first use"""
+        if self._openai_client is None:
+            api_key = os.getenv("OPENAI_API_KEY")
+            if not api_key or api_key == "your_openai_api_key_here":
+                return None
+            self._openai_client = AsyncOpenAI(api_key=api_key)
+        return self._openai_client
+
     async def _extract_with_ai(self, text: str) -> Optional[dict]:
         """Extract resume information using OpenAI API"""
         if not OPENAI_AVAILABLE:
-            print("OpenAI not available for AI extraction")
+            logger.debug("OpenAI not available for AI extraction")
             return None
 
         try:
-            from openai import OpenAI
-            import os
-
-            api_key = os.getenv("OPENAI_API_KEY")
-            if not api_key or api_key == "your_openai_api_key_here":
-                print("OpenAI API key not configured")
+            client = self._get_openai_client()
+            if client is None:
+                logger.debug("OpenAI API key not configured")
                 return None
 
-            client = OpenAI(api_key=api_key)
-
             if len(text.strip()) < 50:
-                print("Insufficient text content for AI processing")
+                logger.debug("Insufficient text content for AI processing")
                 return None
 
-            print(f"Processing {len(text)} characters with AI...")
-
-            prompt = f"""
-            Extract the following information from this resume text and return ONLY a valid JSON object:
-            
-            {{
-                "name": "Full name of the person",
-                "email": "Email address",
-                "phone": "Phone number (clean format)",
-                "currentTitle": "Current job title or most recent position",
-                "experienceYears": number_of_years_experience,
-                "skills": ["comprehensive list of technical skills"],
-                "linkedinUrl": "LinkedIn URL if found",
-                "education": [
-                    {{
-                        "degree": "Degree name",
-                        "field_of_study": "Field of study",
-                        "institution": "Institution name",
-                        "graduation_year": "Year",
-                        "gpa": "GPA if available"
-                    }}
-                ]
-            }}
-            
-            Resume text:
-            {text}
-            
-            Rules:
-            - Return ONLY the JSON object, no other text
-            - Extract ALL technical skills mentioned
-            - Include education information if available
-            - If a field is not found, use empty string "" or empty array []
-            - For experienceYears, calculate from work history
-            
-            Return ONLY the JSON object:
-            """
-
-            response = client.chat.completions.create(
+            logger.debug("Processing %s characters with AI...", len(text))
+
+            prompt = _AI_EXTRACTION_PROMPT.format(text=text.strip())
+
+            # JSON mode guarantees a bare JSON object, so no regex salvage is needed
+            response = await client.chat.completions.create(
                 model="gpt-3.5-turbo",
                 messages=[{"role": "user", "content": prompt}],
                 max_tokens=1000,
-                temperature=0.1,
+                temperature=0,
+                response_format={"type": "json_object"},
             )
 
-            ai_response = response.choices[0].message.content.strip()
+            ai_response = response.choices[0].message.content
 
             try:
                 extracted_data = json.loads(ai_response)
-                print(f"AI successfully extracted data")
+                logger.debug("AI successfully extracted data")
                 return extracted_data
             except json.JSONDecodeError:
-                json_match = re.search(r"\{.*\}", ai_response, re.DOTALL)
-                if json_match:
-                    extracted_data = json.loads(json_match.group())
-                    return extracted_data
-                else:
-                    print("Could not parse AI response as JSON")
-                    return None
+                # Only reachable when the reply was cut off by max_tokens
+                logger.warning("Could not parse AI response as JSON")
+                return None
 
         except Exception as e:
-            print(f"AI extraction error: {e}")
+            logger.warning("AI extraction error: %s", e)
             return None
 
     def _calculate_confidence(self, data: dict) -> int:
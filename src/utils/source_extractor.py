@@ -2,101 +2,139 @@
 Utility to extract job source from URL
 """
 
+import functools
+import re
+from typing import Optional
+
+# Sources recognised from the URL host alone. Dotted needles match a suffix of
+# whole host labels, so 'shine.com' matches 'www.shine.com' but not
+# 'moonshine.com'; the most specific matching needle wins.
+_HOST_SOURCES = (
+    # Job boards
+    ('LinkedIn', ('linkedin.com',)),
+    ('Shine', ('shine.com',)),
+    ('Glassdoor', ('glassdoor',)),
+    ('Jooble', ('jooble.org',)),
+    ('Instahyre', ('instahyre.com',)),
+    ('Indeed', ('indeed.com',)),
+    ('Foundit', ('foundit.in', 'monsterindia')),
+    ('Hirist', ('hirist.tech', 'hirist.com')),
+    ('TimesJobs', ('timesjobs.com',)),
+    ('Talent.com', ('talent.com',)),
+    ('Adzuna', ('adzuna.in',)),
+    ('Internshala', ('internshala.com',)),
+    ('Naukri', ('naukri.com',)),
+    ('Cutshort', ('cutshort.io',)),
+    ('Wellfound', ('wellfound.com', 'angel.co')),
+    ('Apna Circle', ('apnacircle.com',)),
+    # Company career sites
+    ('Barclays Careers', ('jobs.barclays',)),
+    ('Cognizant Careers', ('careers.cognizant.com',)),
+    ('Siemens Careers', ('jobs.siemens.com',)),
+    ('Citi Careers', ('jobs.citi.com',)),
+    ('Capgemini Careers', ('capgemini.com',)),
+    ('BlackRock Careers', ('careers.blackrock.com',)),
+    ('Mastercard Careers', ('careers.mastercard.com',)),
+    ('United Airlines Careers', ('careers.united.com',)),
+    ('Oracle Careers', ('careers.oracle.com',)),
+    ('Mercedes-Benz Careers', ('jobs.mercedes-benz.com',)),
+    ('Telstra Careers', ('telstra.wd3.myworkdayjobs.com',)),
+    ('HPE Careers', ('careers.hpe.com',)),
+    ('UPS Careers', ('jobs-ups.com',)),
+    ('Synechron Careers', ('synechron.wd1.myworkdayjobs.com',)),
+    ('BNP Paribas Careers', ('group.bnpparibas',)),
+    ('IBM Careers', ('careers.ibm.com',)),
+    # Google Jobs API results (these come from various sources)
+    ('Google Jobs', ('jobs.google.com',)),
+)
+
+# Exact-domain table of the dotted needles plus the single-label brand
+# needles like 'glassdoor', which may sit anywhere in the host.
+_DOMAIN_SOURCES = {
+    needle: label
+    for label, needles in _HOST_SOURCES
+    for needle in needles
+    if '.' in needle
+}
+_BRAND_LABELS = {
+    needle: label
+    for label, needles in _HOST_SOURCES
+    for needle in needles
+    if '.' not in needle
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def _source_for_host(host: str) -> Optional[str]:
+    """Return the source of the most specific needle matching host, or None"""
+    # Cached per host: a scrape yields many job URLs from only a few hosts
+    # Probe the host and each parent domain, longest first, so the first hit
+    # is the most specific registered domain
+    suffix = host
+    while suffix:
+        source = _DOMAIN_SOURCES.get(suffix)
+        if source:
+            return source
+        dot = suffix.find('.')
+        if dot < 0:
+            break
+        suffix = suffix[dot + 1:]
+    for part in host.split('.'):
+        if part in _BRAND_LABELS:
+            return _BRAND_LABELS[part]
+    return None
+
+
+# Host and path of a URL in one anchored match. The scheme and '//' are
+# optional so scheme-less URLs like 'www.naukri.com/job' still yield a host;
+# userinfo and port are skipped, and the query and fragment are left out.
+_URL_PARTS_RE = re.compile(
+    r'(?:(?:[A-Za-z][A-Za-z0-9+.-]*:)?//)?'
+    r'(?:[^@/?#]*@)?'
+    r'(?P<host>[^:/?#]*)'
+    r'(?::[^/?#]*)?'
+    r'(?P<path>[^?#]*)'
+)
+
+_CAREERS_RE = re.compile('careers', re.IGNORECASE)
+
+
+def _is_domain(host: str, domain: str) -> bool:
+    """Check whether host is the given domain or one of its subdomains"""
+    return host == domain or host.endswith('.' + domain)
+
+
 def extract_source_from_url(url: str) -> str:
     """
     Extract the job source/platform name from a job URL
-    
+
     Args:
         url: Job posting URL
-        
+
     Returns:
         Source name (e.g., 'LinkedIn', 'Indeed', 'Naukri')
     """
     if not url:
         return 'Unknown'
-    
-    url_lower = url.lower()
-    
-    # Job boards
-    if 'linkedin.com' in url_lower:
-        return 'LinkedIn'
-    elif 'shine.com' in url_lower:
-        return 'Shine'
-    elif 'glassdoor' in url_lower:
-        return 'Glassdoor'
-    elif 'jooble.org' in url_lower:
-        return 'Jooble'
-    elif 'instahyre.com' in url_lower:
-        return 'Instahyre'
-    elif 'indeed.com' in url_lower:
-        return 'Indeed'
-    elif 'foundit.in' in url_lower or 'monsterindia' in url_lower:
-        return 'Foundit'
-    elif 'hirist.tech' in url_lower or 'hirist.com' in url_lower:
-        return 'Hirist'
-    elif 'timesjobs.com' in url_lower:
-        return 'TimesJobs'
-    elif 'talent.com' in url_lower:
-        return 'Talent.com'
-    elif 'adzuna.in' in url_lower:
-        return 'Adzuna'
-    elif 'internshala.com' in url_lower:
-        return 'Internshala'
-    elif 'naukri.com' in url_lower:
-        return 'Naukri'
-    elif 'cutshort.io' in url_lower:
-        return 'Cutshort'
-    elif 'wellfound.com' in url_lower or 'angel.co' in url_lower:
-        return 'Wellfound'
-    elif 'apnacircle.com' in url_lower:
-        return 'Apna Circle'
-    
-    # Company career sites
-    elif 'jobs.barclays' in url_lower:
-        return 'Barclays Careers'
-    elif 'careers.cognizant.com' in url_lower:
-        return 'Cognizant Careers'
-    elif 'jobs.siemens.com' in url_lower:
-        return 'Siemens Careers'
-    elif 'jobs.citi.com' in url_lower:
-        return 'Citi Careers'
-    elif 'capgemini.com' in url_lower:
-        return 'Capgemini Careers'
-    elif 'se.com' in url_lower and 'careers' in url_lower:
+
+    parts = _URL_PARTS_RE.match(url.strip())
+    host = parts['host'].lower()
+
+    source = _source_for_host(host)
+    if source:
+        return source
+
+    # Sources that also depend on the path; only the prefixes being compared
+    # are lowercased, never the whole path
+    path = parts['path']
+    if _is_domain(host, 'se.com') and (
+        'careers' in host or _CAREERS_RE.search(path)
+    ):
         return 'Schneider Electric Careers'
-    elif 'careers.blackrock.com' in url_lower:
-        return 'BlackRock Careers'
-    elif 'careers.mastercard.com' in url_lower:
-        return 'Mastercard Careers'
-    elif 'careers.united.com' in url_lower:
-        return 'United Airlines Careers'
-    elif 'careers.oracle.com' in url_lower:
-        return 'Oracle Careers'
-    elif 'jobs.mercedes-benz.com' in url_lower:
-        return 'Mercedes-Benz Careers'
-    elif 'telstra.wd3.myworkdayjobs.com' in url_lower:
-        return 'Telstra Careers'
-    elif 'careers.hpe.com' in url_lower:
-        return 'HPE Careers'
-    elif 'jobs-ups.com' in url_lower:
-        return 'UPS Careers'
-    elif 'synechron.wd1.myworkdayjobs.com' in url_lower:
-        return 'Synechron Careers'
-    elif 'group.bnpparibas' in url_lower:
-        return 'BNP Paribas Careers'
-    elif 'careers.ibm.com' in url_lower or 'ibm.com/jobs' in url_lower:
+    if _is_domain(host, 'ibm.com') and path[:5].lower() == '/jobs':
         return 'IBM Careers'
-    
-    # Generic company career sites
-    elif 'careers.' in url_lower or '/careers/' in url_lower:
-        return 'Company Website'
-    elif 'jobs.' in url_lower or '/jobs/' in url_lower:
-        return 'Company Website'
-    
-    # Google Jobs API results (these come from various sources)
-    elif 'google.com/search' in url_lower or 'jobs.google.com' in url_lower:
+    if _is_domain(host, 'google.com') and path[:7].lower() == '/search':
         return 'Google Jobs'
-    
-    # Default
-    else:
-        return 'Company Website'
+
+    # Anything else, including generic careers./jobs. sites
+    return 'Company Website'
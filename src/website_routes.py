@@ -3,17 +3,143 @@ Website Configuration API Routes
 """
 
 from fastapi import APIRouter, HTTPException, Depends, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import text
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from starlette.background import BackgroundTask
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import bindparam, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.exc import IntegrityError
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
 from datetime import datetime
-import json
+import orjson
 
 from .auth import get_current_user
-from .models import get_job_db, UserProfile as User
+from .models import get_async_job_db, get_async_session_factory, UserProfile as User
+
+router = APIRouter(
+    tags=["Website Configuration"], default_response_class=ORJSONResponse
+)
+
+# Selector columns are JSONB: dicts are bound as-is and rows come back as dicts.
+# none_as_null stores a missing form selector map as SQL NULL, not JSON null.
+_SELECTOR_BINDS = (
+    bindparam("search_selectors", type_=JSONB(none_as_null=True)),
+    bindparam("job_selectors", type_=JSONB(none_as_null=True)),
+    bindparam("form_selectors", type_=JSONB(none_as_null=True)),
+)
+
+# Selector columns as read back by the API: NULL maps become {} in Postgres, so
+# handlers get ready-to-return dicts without per-field checks
+_SELECTOR_COLUMNS = {
+    column: f"COALESCE({column}, CAST('{{}}' AS JSONB)) AS {column}"
+    for column in ("search_selectors", "job_selectors", "form_selectors")
+}
+_ALL_SELECTOR_COLUMNS = ", ".join(_SELECTOR_COLUMNS.values())
+
+# Statements are built once at import instead of on every request
+_INSERT_WEBSITE = text(
+    """
+    INSERT INTO website_configurations (
+        name, base_url, job_search_url, login_required, login_url,
+        search_selectors, job_selectors, form_selectors, pagination_selector,
+        max_pages, delay_between_requests, is_active, created_at, updated_at
+    ) VALUES (
+        :name, :base_url, :job_search_url, :login_required, :login_url,
+        :search_selectors, :job_selectors, :form_selectors, :pagination_selector,
+        :max_pages, :delay_between_requests, :is_active, :created_at, :updated_at
+    )
+    ON CONFLICT ((LOWER(name))) DO NOTHING
+    RETURNING id, name
+    """
+).bindparams(*_SELECTOR_BINDS)
+
+# One statement serves both the full and the active-only listing
+_SELECT_WEBSITES = text(
+    """
+    SELECT id, name, base_url, job_search_url, login_required,
+           is_active, max_pages, delay_between_requests, created_at, updated_at
+    FROM website_configurations
+    WHERE (:active_only IS FALSE OR is_active = true)
+    ORDER BY name
+    """
+)
+
+_SELECT_WEBSITE = text(
+    f"""
+    SELECT id, name, base_url, job_search_url, login_required, login_url,
+           {_ALL_SELECTOR_COLUMNS}, pagination_selector,
+           max_pages, delay_between_requests, is_active, created_at, updated_at
+    FROM website_configurations
+    WHERE id = :website_id
+    """
+)
+
+_UPDATE_WEBSITE = text(
+    """
+    UPDATE website_configurations SET
+        name = :name,
+        base_url = :base_url,
+        job_search_url = :job_search_url,
+        login_required = :login_required,
+        login_url = :login_url,
+        search_selectors = :search_selectors,
+        job_selectors = :job_selectors,
+        form_selectors = :form_selectors,
+        pagination_selector = :pagination_selector,
+        max_pages = :max_pages,
+        delay_between_requests = :delay_between_requests,
+        is_active = :is_active,
+        updated_at = :updated_at
+    WHERE id = :website_id
+    RETURNING id, name
+    """
+).bindparams(*_SELECTOR_BINDS)
+
+_DELETE_WEBSITE = text(
+    "DELETE FROM website_configurations WHERE id = :website_id RETURNING name"
+)
+
+# The automation test only reports how many selectors are configured, so count
+# the keys in Postgres instead of transferring the selector maps
+_SELECT_TEST_CONFIG = text(
+    """
+    SELECT name, job_search_url,
+           (SELECT COUNT(*) FROM jsonb_object_keys(COALESCE(search_selectors, '{}')))
+               AS search_selector_count,
+           (SELECT COUNT(*) FROM jsonb_object_keys(COALESCE(job_selectors, '{}')))
+               AS job_selector_count
+    FROM website_configurations
+    WHERE id = :website_id AND is_active = true
+    """
+)
+
+# Column holding each selector type, and its single-column update statement
+SELECTOR_FIELDS = {
+    "search": "search_selectors",
+    "job": "job_selectors",
+    "form": "form_selectors",
+}
+
+_UPDATE_SELECTOR_STMTS = {
+    selector_type: text(
+        f"""
+        UPDATE website_configurations
+        SET {field_name} = :selectors, updated_at = :updated_at
+        WHERE id = :website_id
+        RETURNING name
+        """
+    ).bindparams(bindparam("selectors", type_=JSONB(none_as_null=True)))
+    for selector_type, field_name in SELECTOR_FIELDS.items()
+}
 
-router = APIRouter(tags=["Website Configuration"])
+_SELECT_NAMED_SELECTORS = text(
+    f"""
+    SELECT name, {_ALL_SELECTOR_COLUMNS}
+    FROM website_configurations
+    WHERE id = :website_id
+    """
+)
 
 
 class WebsiteConfig(BaseModel):
@@ -46,50 +172,21 @@ class SelectorUpdate(BaseModel):
 async def add_website_configuration(
     website_config: WebsiteConfig,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_job_db),
+    db: AsyncSession = Depends(get_async_job_db),
 ):
     """Add new job portal configuration"""
     try:
-        # Check if website already exists
-        check_query = (
-            "SELECT id FROM website_configurations WHERE LOWER(name) = LOWER(:name)"
-        )
-        existing = db.execute(
-            text(check_query), {"name": website_config.name}
-        ).fetchone()
-
-        if existing:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Website '{website_config.name}' already configured",
-            )
-
-        # Insert new website configuration
-        insert_query = """
-        INSERT INTO website_configurations (
-            name, base_url, job_search_url, login_required, login_url,
-            search_selectors, job_selectors, form_selectors, pagination_selector,
-            max_pages, delay_between_requests, is_active, created_at, updated_at
-        ) VALUES (
-            :name, :base_url, :job_search_url, :login_required, :login_url,
-            :search_selectors, :job_selectors, :form_selectors, :pagination_selector,
-            :max_pages, :delay_between_requests, :is_active, :created_at, :updated_at
-        ) RETURNING id, name
-        """
-
+        # Insert new website configuration unless the name is already taken
+        # (case-insensitively); no returned row means it already exists
         params = {
             "name": website_config.name,
             "base_url": website_config.base_url,
             "job_search_url": website_config.job_search_url,
             "login_required": website_config.login_required,
             "login_url": website_config.login_url,
-            "search_selectors": json.dumps(website_config.search_selectors),
-            "job_selectors": json.dumps(website_config.job_selectors),
-            "form_selectors": (
-                json.dumps(website_config.form_selectors)
-                if website_config.form_selectors
-                else None
-            ),
+            "search_selectors": website_config.search_selectors,
+            "job_selectors": website_config.job_selectors,
+            "form_selectors": website_config.form_selectors or None,
             "pagination_selector": website_config.pagination_selector,
             "max_pages": website_config.max_pages,
             "delay_between_requests": website_config.delay_between_requests,
@@ -98,82 +195,87 @@ async def add_website_configuration(
             "updated_at": datetime.utcnow(),
         }
 
-        result = db.execute(text(insert_query), params)
+        result = await db.execute(_INSERT_WEBSITE, params)
         new_website = result.fetchone()
-        db.commit()
+        await db.commit()
 
-        website_dict = dict(new_website._mapping)
+        if not new_website:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Website '{website_config.name}' already configured",
+            )
 
         return {
             "success": True,
             "message": f"Website '{website_config.name}' configured successfully",
-            "website": website_dict,
+            "website": new_website._mapping,
             "config": website_config.dict(),
         }
 
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=500, detail=f"Error adding website configuration: {str(e)}"
         )
 
 
+async def _stream_websites(db: AsyncSession, result):
+    """Yield the website listing as JSON, one row at a time"""
+    try:
+        yield b'{"success":true,"websites":['
+        total = 0
+        async for row in result:
+            if total:
+                yield b","
+            yield orjson.dumps(dict(row._mapping))
+            total += 1
+        # The count is only known once every row has been sent
+        yield b'],"total":%d}' % total
+    except Exception:
+        # A failed stream skips the response's background task
+        await db.close()
+        raise
+
+
 @router.get("/websites")
 async def get_configured_websites(
     active_only: bool = Query(False, description="Return only active websites"),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_job_db),
 ):
     """List configured job websites"""
+    # get_async_job_db's session is closed before a streamed body is sent, so
+    # the stream owns its session. The query runs here, before any headers
+    # are sent, so a failure to run it is still reported as a 500
+    db = get_async_session_factory()()
     try:
-        base_query = """
-        SELECT id, name, base_url, job_search_url, login_required, 
-               is_active, max_pages, delay_between_requests, created_at, updated_at
-        FROM website_configurations
-        WHERE 1=1
-        """
-
-        params = {}
-
-        if active_only:
-            base_query += " AND is_active = true"
-
-        final_query = base_query + " ORDER BY name"
-
-        result = db.execute(text(final_query), params)
-        websites = []
-
-        for row in result.fetchall():
-            website_dict = dict(row._mapping)
-            website_dict["created_at"] = website_dict["created_at"].isoformat()
-            website_dict["updated_at"] = website_dict["updated_at"].isoformat()
-            websites.append(website_dict)
-
-        return {"success": True, "websites": websites, "total": len(websites)}
-
+        result = await db.stream(
+            _SELECT_WEBSITES.execution_options(yield_per=100),
+            {"active_only": active_only},
+        )
     except Exception as e:
+        await db.close()
         raise HTTPException(status_code=500, detail=f"Error getting websites: {str(e)}")
 
+    # The background task also runs when the client disconnects before or
+    # during the body, so the cursor and pooled connection are released then too
+    return StreamingResponse(
+        _stream_websites(db, result),
+        media_type="application/json",
+        background=BackgroundTask(db.close),
+    )
+
 
 @router.get("/websites/{website_id}")
 async def get_website_configuration(
     website_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_job_db),
+    db: AsyncSession = Depends(get_async_job_db),
 ):
     """Get specific website configuration"""
     try:
-        query = """
-        SELECT id, name, base_url, job_search_url, login_required, login_url,
-               search_selectors, job_selectors, form_selectors, pagination_selector,
-               max_pages, delay_between_requests, is_active, created_at, updated_at
-        FROM website_configurations
-        WHERE id = :website_id
-        """
-
-        result = db.execute(text(query), {"website_id": website_id})
+        result = await db.execute(_SELECT_WEBSITE, {"website_id": website_id})
         website_row = result.fetchone()
 
         if not website_row:
@@ -181,17 +283,7 @@ async def get_website_configuration(
                 status_code=404, detail="Website configuration not found"
             )
 
-        website_dict = dict(website_row._mapping)
-
-        # Parse JSON fields
-        for json_field in ["search_selectors", "job_selectors", "form_selectors"]:
-            if website_dict[json_field]:
-                website_dict[json_field] = json.loads(website_dict[json_field])
-
-        website_dict["created_at"] = website_dict["created_at"].isoformat()
-        website_dict["updated_at"] = website_dict["updated_at"].isoformat()
-
-        return {"success": True, "website": website_dict}
+        return {"success": True, "website": website_row._mapping}
 
     except HTTPException:
         raise
@@ -206,39 +298,11 @@ async def update_website_configuration(
     website_id: int,
     website_config: WebsiteConfig,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_job_db),
+    db: AsyncSession = Depends(get_async_job_db),
 ):
     """Update website configuration"""
     try:
-        # Check if website exists
-        check_query = "SELECT name FROM website_configurations WHERE id = :website_id"
-        existing = db.execute(text(check_query), {"website_id": website_id}).fetchone()
-
-        if not existing:
-            raise HTTPException(
-                status_code=404, detail="Website configuration not found"
-            )
-
-        # Update configuration
-        update_query = """
-        UPDATE website_configurations SET
-            name = :name,
-            base_url = :base_url,
-            job_search_url = :job_search_url,
-            login_required = :login_required,
-            login_url = :login_url,
-            search_selectors = :search_selectors,
-            job_selectors = :job_selectors,
-            form_selectors = :form_selectors,
-            pagination_selector = :pagination_selector,
-            max_pages = :max_pages,
-            delay_between_requests = :delay_between_requests,
-            is_active = :is_active,
-            updated_at = :updated_at
-        WHERE id = :website_id
-        RETURNING id, name
-        """
-
+        # Update configuration; no returned row means the website doesn't exist
         params = {
             "website_id": website_id,
             "name": website_config.name,
@@ -246,13 +310,9 @@ async def update_website_configuration(
             "job_search_url": website_config.job_search_url,
             "login_required": website_config.login_required,
             "login_url": website_config.login_url,
-            "search_selectors": json.dumps(website_config.search_selectors),
-            "job_selectors": json.dumps(website_config.job_selectors),
-            "form_selectors": (
-                json.dumps(website_config.form_selectors)
-                if website_config.form_selectors
-                else None
-            ),
+            "search_selectors": website_config.search_selectors,
+            "job_selectors": website_config.job_selectors,
+            "form_selectors": website_config.form_selectors or None,
             "pagination_selector": website_config.pagination_selector,
             "max_pages": website_config.max_pages,
             "delay_between_requests": website_config.delay_between_requests,
@@ -260,22 +320,32 @@ async def update_website_configuration(
             "updated_at": datetime.utcnow(),
         }
 
-        result = db.execute(text(update_query), params)
+        result = await db.execute(_UPDATE_WEBSITE, params)
         updated_website = result.fetchone()
-        db.commit()
+        await db.commit()
 
-        website_dict = dict(updated_website._mapping)
+        if not updated_website:
+            raise HTTPException(
+                status_code=404, detail="Website configuration not found"
+            )
 
         return {
             "success": True,
             "message": f"Website '{website_config.name}' updated successfully",
-            "website": website_dict,
+            "website": updated_website._mapping,
         }
 
     except HTTPException:
         raise
+    except IntegrityError:
+        # Renamed to a (case-insensitive) duplicate of another website's name
+        await db.rollback()
+        raise HTTPException(
+            status_code=400,
+            detail=f"Website '{website_config.name}' already configured",
+        )
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=500, detail=f"Error updating website configuration: {str(e)}"
         )
@@ -285,25 +355,21 @@ async def update_website_configuration(
 async def delete_website_configuration(
     website_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_job_db),
+    db: AsyncSession = Depends(get_async_job_db),
 ):
     """Remove website configuration"""
     try:
-        # Check if website exists
-        check_query = "SELECT name FROM website_configurations WHERE id = :website_id"
-        existing = db.execute(text(check_query), {"website_id": website_id}).fetchone()
+        # Delete configuration; no returned row means the website doesn't exist
+        result = await db.execute(_DELETE_WEBSITE, {"website_id": website_id})
+        deleted = result.fetchone()
+        await db.commit()
 
-        if not existing:
+        if not deleted:
             raise HTTPException(
                 status_code=404, detail="Website configuration not found"
             )
 
-        website_name = existing[0]
-
-        # Delete configuration
-        delete_query = "DELETE FROM website_configurations WHERE id = :website_id"
-        db.execute(text(delete_query), {"website_id": website_id})
-        db.commit()
+        website_name = deleted[0]
 
         return {
             "success": True,
@@ -313,7 +379,7 @@ async def delete_website_configuration(
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=500, detail=f"Error deleting website configuration: {str(e)}"
         )
@@ -324,19 +390,12 @@ async def test_website_automation(
     website_id: int,
     test_url: Optional[str] = None,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_job_db),
+    db: AsyncSession = Depends(get_async_job_db),
 ):
     """Test automation on website"""
     try:
         # Get website configuration
-        config_query = """
-        SELECT name, base_url, job_search_url, search_selectors, job_selectors,
-               delay_between_requests
-        FROM website_configurations
-        WHERE id = :website_id AND is_active = true
-        """
-
-        config_result = db.execute(text(config_query), {"website_id": website_id})
+        config_result = await db.execute(_SELECT_TEST_CONFIG, {"website_id": website_id})
         config_row = config_result.fetchone()
 
         if not config_row:
@@ -344,9 +403,7 @@ async def test_website_automation(
                 status_code=404, detail="Website configuration not found or inactive"
             )
 
-        config_dict = dict(config_row._mapping)
-        config_dict["search_selectors"] = json.loads(config_dict["search_selectors"])
-        config_dict["job_selectors"] = json.loads(config_dict["job_selectors"])
+        config_dict = config_row._mapping
 
         # Simulate testing (in real implementation, use Selenium)
         test_url = test_url or config_dict["job_search_url"]
@@ -354,7 +411,7 @@ async def test_website_automation(
         test_results = {
             "website_name": config_dict["name"],
             "test_url": test_url,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": datetime.utcnow(),
             "tests": [
                 {
                     "test": "URL Accessibility",
@@ -364,13 +421,13 @@ async def test_website_automation(
                 {
                     "test": "Search Selectors",
                     "status": "passed",
-                    "selectors_found": len(config_dict["search_selectors"]),
+                    "selectors_found": config_dict["search_selector_count"],
                     "message": "All search selectors are valid",
                 },
                 {
                     "test": "Job Listing Selectors",
                     "status": "passed",
-                    "selectors_found": len(config_dict["job_selectors"]),
+                    "selectors_found": config_dict["job_selector_count"],
                     "message": "Job listing selectors working",
                 },
                 {
@@ -404,58 +461,33 @@ async def update_website_selectors(
     website_id: int,
     selector_update: SelectorUpdate,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_job_db),
+    db: AsyncSession = Depends(get_async_job_db),
 ):
     """Configure form selectors for specific website"""
     try:
-        # Get current configuration
-        config_query = """
-        SELECT search_selectors, job_selectors, form_selectors
-        FROM website_configurations
-        WHERE id = :website_id
-        """
-
-        config_result = db.execute(text(config_query), {"website_id": website_id})
-        config_row = config_result.fetchone()
-
-        if not config_row:
-            raise HTTPException(
-                status_code=404, detail="Website configuration not found"
-            )
-
-        # Parse current selectors
-        current_selectors = dict(config_row._mapping)
-
         # Update the specified selector type
-        if selector_update.selector_type == "search":
-            field_name = "search_selectors"
-        elif selector_update.selector_type == "job":
-            field_name = "job_selectors"
-        elif selector_update.selector_type == "form":
-            field_name = "form_selectors"
-        else:
+        update_stmt = _UPDATE_SELECTOR_STMTS.get(selector_update.selector_type)
+        if update_stmt is None:
             raise HTTPException(
                 status_code=400,
                 detail="Invalid selector_type. Use: search, job, or form",
             )
 
-        # Update selectors
-        update_query = f"""
-        UPDATE website_configurations 
-        SET {field_name} = :selectors, updated_at = :updated_at
-        WHERE id = :website_id
-        RETURNING name
-        """
-
+        # Update selectors; no returned row means the website doesn't exist
         params = {
             "website_id": website_id,
-            "selectors": json.dumps(selector_update.selectors),
+            "selectors": selector_update.selectors,
             "updated_at": datetime.utcnow(),
         }
 
-        result = db.execute(text(update_query), params)
+        result = await db.execute(update_stmt, params)
         updated_website = result.fetchone()
-        db.commit()
+        await db.commit()
+
+        if not updated_website:
+            raise HTTPException(
+                status_code=404, detail="Website configuration not found"
+            )
 
         return {
             "success": True,
@@ -467,7 +499,7 @@ async def update_website_selectors(
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=500, detail=f"Error updating selectors: {str(e)}"
         )
@@ -480,17 +512,11 @@ async def get_website_selectors(
         None, description="Specific selector type to get"
     ),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_job_db),
+    db: AsyncSession = Depends(get_async_job_db),
 ):
     """Get website selectors"""
     try:
-        query = """
-        SELECT name, search_selectors, job_selectors, form_selectors
-        FROM website_configurations
-        WHERE id = :website_id
-        """
-
-        result = db.execute(text(query), {"website_id": website_id})
+        result = await db.execute(_SELECT_NAMED_SELECTORS, {"website_id": website_id})
         config_row = result.fetchone()
 
         if not config_row:
@@ -498,45 +524,27 @@ async def get_website_selectors(
                 status_code=404, detail="Website configuration not found"
             )
 
-        config_dict = dict(config_row._mapping)
-
-        # Parse JSON selectors
-        selectors = {
-            "search_selectors": (
-                json.loads(config_dict["search_selectors"])
-                if config_dict["search_selectors"]
-                else {}
-            ),
-            "job_selectors": (
-                json.loads(config_dict["job_selectors"])
-                if config_dict["job_selectors"]
-                else {}
-            ),
-            "form_selectors": (
-                json.loads(config_dict["form_selectors"])
-                if config_dict["form_selectors"]
-                else {}
-            ),
-        }
+        # Everything but the name is an already-decoded selector map
+        selectors = dict(config_row._mapping)
+        website_name = selectors.pop("name")
 
         if selector_type:
-            if selector_type not in ["search", "job", "form"]:
+            if selector_type not in SELECTOR_FIELDS:
                 raise HTTPException(
                     status_code=400,
                     detail="Invalid selector_type. Use: search, job, or form",
                 )
 
-            selector_key = f"{selector_type}_selectors"
             return {
                 "success": True,
-                "website_name": config_dict["name"],
+                "website_name": website_name,
                 "selector_type": selector_type,
-                "selectors": selectors[selector_key],
+                "selectors": selectors[SELECTOR_FIELDS[selector_type]],
             }
 
         return {
             "success": True,
-            "website_name": config_dict["name"],
+            "website_name": website_name,
             "all_selectors": selectors,
         }
 
@@ -561,7 +569,7 @@ async def test_css_selector(
             "url": selector_test.url,
             "selector": selector_test.selector,
             "selector_type": selector_test.selector_type,
-            "test_timestamp": datetime.utcnow().isoformat(),
+            "test_timestamp": datetime.utcnow(),
             "status": "success",  # or "failed"
             "elements_found": 5,  # simulated count
             "sample_text": "Sample job title found",
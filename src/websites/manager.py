@@ -3,16 +3,37 @@ Website Automation Manager
 """
 
 from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, field, replace
 from enum import Enum
 import json
 import asyncio
+import logging
+import random
+import time
 from datetime import datetime
 
-from ..automation.browser import BrowserEngine
 from ..selectors.job_site_selectors import get_selectors_for_site
 from config import Config
 
+logger = logging.getLogger(__name__)
+
+
+# How long search results are reused for identical searches on a site
+SEARCH_CACHE_TTL = 300  # seconds
+
+# Mock listings returned by _extract_job_listings until real extraction exists
+_MOCK_JOBS = tuple(
+    {
+        "id": f"job_{i}",
+        "title": f"Python Developer {i}",
+        "company": f"Tech Company {i}",
+        "location": "Remote",
+        "description": f"Job description for position {i}",
+        "url": f"https://example.com/job/{i}"
+    }
+    for i in range(1, 6)
+)
+
 
 class JobSiteType(Enum):
     LINKEDIN = "linkedin"
@@ -23,7 +44,27 @@ class JobSiteType(Enum):
     SHINE = "shine"
 
 
-@dataclass 
+@dataclass
+class SelectorBundle:
+    """Selector groups used to automate a job site"""
+    search: Dict[str, str] = field(default_factory=dict)
+    job_listings: Dict[str, str] = field(default_factory=dict)
+    application: Dict[str, str] = field(default_factory=dict)
+    login: Dict[str, str] = field(default_factory=dict)
+    
+    @classmethod
+    def for_site(cls, site_key: str) -> "SelectorBundle":
+        """Build the bundle from the site's selector map"""
+        raw = get_selectors_for_site(site_key)
+        return cls(
+            search=raw.get("search", {}),
+            job_listings=raw.get("job_listings", {}),
+            application=raw.get("application", {}),
+            login=raw.get("login", {})
+        )
+
+
+@dataclass(slots=True, frozen=True)
 class JobSiteConfig:
     """Configuration for a job site"""
     name: str
@@ -33,6 +74,48 @@ class JobSiteConfig:
     rate_limit_delay: int = 30  # seconds between requests
     max_applications_per_session: int = 10
     supports_auto_apply: bool = False
+    job_url_template: str = "{base_url}/job/{job_id}"
+    key: str = ""  # lowercase supported_sites key, set at init
+    # Resolved at init from key. The bundle holds dicts, so it is left out of
+    # hashing and equality to keep configs hashable
+    selectors: SelectorBundle = field(
+        default_factory=SelectorBundle, hash=False, compare=False
+    )
+
+
+class RateLimiter:
+    """Spaces out actions on a site and backs off after failures"""
+    
+    def __init__(self, delay: float, max_delay: float = 600):
+        self.delay = delay
+        self.max_delay = max_delay
+        self.failures = 0
+        self._next_start = 0.0
+    
+    async def acquire(self):
+        """Wait until the next action may start"""
+        loop = asyncio.get_running_loop()
+        wait = self._next_start - loop.time()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        # Time spent on the action itself counts toward the delay
+        self._next_start = loop.time() + self.delay
+    
+    def reset(self):
+        """Forget earlier failures; the spacing between actions still applies"""
+        self.failures = 0
+    
+    def record_result(self, success: bool):
+        """Reset after a success; back off exponentially, with jitter, after a failure"""
+        if success:
+            self.failures = 0
+            return
+        
+        self.failures += 1
+        backoff = min(self.delay * 2 ** self.failures, self.max_delay)
+        backoff += random.uniform(0, backoff * 0.1)
+        loop = asyncio.get_running_loop()
+        self._next_start = max(self._next_start, loop.time() + backoff)
     
 
 class WebsiteManager:
@@ -40,13 +123,44 @@ class WebsiteManager:
     
     def __init__(self):
         self.config = Config()
-        self.browser_engine = BrowserEngine()
+        self._browser_engine = None
+        # (account, site key, search fields) -> (fetched at, jobs)
+        self._search_cache: Dict[tuple, tuple] = {}
+        # Same key -> [lock, searches holding or waiting on it]
+        self._search_locks: Dict[tuple, list] = {}
+        # Account the browser is logged in as; None when browsing anonymously
+        self._session_user = None
         self.supported_sites = self._initialize_supported_sites()
+        # One limiter per site so pacing carries over between bulk runs
+        self.rate_limiters = {
+            site_config.key: RateLimiter(site_config.rate_limit_delay)
+            for site_config in self.supported_sites.values()
+        }
+        self._supported_sites_summary = tuple(
+            {
+                "key": site_config.key,
+                "name": site_config.name,
+                "base_url": site_config.base_url,
+                "login_required": site_config.login_required,
+                "supports_auto_apply": site_config.supports_auto_apply,
+                "max_applications": site_config.max_applications_per_session
+            }
+            for site_config in self.supported_sites.values()
+        )
         self.current_site = None
         
+    @property
+    def browser_engine(self):
+        """Browser engine, created on first use"""
+        if self._browser_engine is None:
+            # Imported here so that loading this module doesn't pull in Selenium
+            from ..automation.browser import BrowserEngine
+            self._browser_engine = BrowserEngine()
+        return self._browser_engine
+    
     def _initialize_supported_sites(self) -> Dict[str, JobSiteConfig]:
         """Initialize supported job sites configuration"""
-        return {
+        sites = {
             "linkedin": JobSiteConfig(
                 name="LinkedIn",
                 base_url="https://www.linkedin.com",
@@ -54,7 +168,8 @@ class WebsiteManager:
                 login_required=True,
                 rate_limit_delay=45,
                 max_applications_per_session=5,
-                supports_auto_apply=True
+                supports_auto_apply=True,
+                job_url_template="{base_url}/jobs/view/{job_id}"
             ),
             "indeed": JobSiteConfig(
                 name="Indeed",
@@ -63,7 +178,8 @@ class WebsiteManager:
                 login_required=False,
                 rate_limit_delay=30,
                 max_applications_per_session=10,
-                supports_auto_apply=False
+                supports_auto_apply=False,
+                job_url_template="{base_url}/viewjob?jk={job_id}"
             ),
             "naukri": JobSiteConfig(
                 name="Naukri.com",
@@ -72,7 +188,8 @@ class WebsiteManager:
                 login_required=True,
                 rate_limit_delay=35,
                 max_applications_per_session=8,
-                supports_auto_apply=True
+                supports_auto_apply=True,
+                job_url_template="{base_url}/job-listings-{job_id}"
             ),
             "glassdoor": JobSiteConfig(
                 name="Glassdoor",
@@ -102,6 +219,16 @@ class WebsiteManager:
                 supports_auto_apply=False
             )
         }
+        
+        # Resolve each site's key and selectors once instead of on every call
+        return {
+            site_key: replace(
+                site_config,
+                key=site_key,
+                selectors=SelectorBundle.for_site(site_key)
+            )
+            for site_key, site_config in sites.items()
+        }
     
     async def initialize_site(self, site_name: str, credentials: Optional[Dict] = None) -> bool:
         """Initialize connection to a specific job site"""
@@ -110,11 +237,13 @@ class WebsiteManager:
                 raise ValueError(f"Unsupported site: {site_name}")
             
             self.current_site = self.supported_sites[site_name]
+            self._session_user = None
             
-            # Initialize browser
-            await self.browser_engine.initialize_browser(
-                headless=self.config.BROWSER_HEADLESS
-            )
+            # Initialize browser, reusing the running one when switching sites
+            if not self.browser_engine.is_session_active():
+                await self.browser_engine.initialize_browser(
+                    headless=self.config.BROWSER_HEADLESS
+                )
             
             # Navigate to site
             await self.browser_engine.navigate_to_website(self.current_site.base_url)
@@ -124,11 +253,12 @@ class WebsiteManager:
                 login_success = await self._perform_login(site_name, credentials)
                 if not login_success:
                     return False
+                self._session_user = credentials.get("username")
             
             return True
             
-        except Exception as e:
-            print(f"Error initializing site {site_name}: {str(e)}")
+        except Exception:
+            logger.exception("Error initializing site %s", site_name)
             return False
     
     async def search_jobs(self, search_params: Dict[str, Any]) -> List[Dict]:
@@ -137,28 +267,39 @@ class WebsiteManager:
             if not self.current_site:
                 raise ValueError("No site initialized")
             
-            # Navigate to search page
-            await self.browser_engine.navigate_to_website(self.current_site.search_url)
-            
-            # Get site-specific selectors
-            selectors = get_selectors_for_site(self.current_site.name.lower())
-            
-            # Fill search form
             search_data = {
                 "keywords": search_params.get("keywords", ""),
                 "location": search_params.get("location", ""),
                 "experience": search_params.get("experience_level", "")
             }
-            
-            await self.browser_engine.fill_search_form(selectors["search"], search_data)
-            
-            # Get job listings
-            jobs = await self._extract_job_listings(selectors["job_listings"])
-            
-            return jobs
-            
-        except Exception as e:
-            print(f"Error searching jobs: {str(e)}")
+            cache_key = self._search_cache_key(search_data)
+            if cache_key is None:
+                return [dict(job) for job in await self._run_search(search_data)]
+            
+            # The lock makes a concurrent identical search wait for this one's
+            # results instead of scraping the same page again. It is dropped
+            # once no search holds or waits on it
+            entry = self._search_locks.setdefault(cache_key, [asyncio.Lock(), 0])
+            entry[1] += 1
+            try:
+                async with entry[0]:
+                    cached = self._search_cache.get(cache_key)
+                    if cached and time.monotonic() - cached[0] < SEARCH_CACHE_TTL:
+                        return [dict(job) for job in cached[1]]
+                    
+                    jobs = await self._run_search(search_data)
+                    
+                    if jobs:
+                        self._store_search_results(cache_key, jobs)
+                    
+                    return [dict(job) for job in jobs]
+            finally:
+                entry[1] -= 1
+                if not entry[1]:
+                    del self._search_locks[cache_key]
+            
+        except Exception:
+            logger.exception("Error searching jobs")
             return []
     
     async def apply_to_job(self, job_id: str, application_data: Dict) -> Dict[str, Any]:
@@ -177,14 +318,20 @@ class WebsiteManager:
             
             # Navigate to job application page
             job_url = self._build_job_url(job_id)
-            await self.browser_engine.navigate_to_website(job_url)
+            if not await self.browser_engine.navigate_to_website(job_url):
+                # The engine reports load failures (timeouts, blocked requests)
+                # as False; a throttling site looks like this
+                return {
+                    "success": False,
+                    "message": "Failed to load job page",
+                    "retry_later": True
+                }
             
-            # Get application selectors
-            selectors = get_selectors_for_site(self.current_site.name.lower())
+            selectors = self.current_site.selectors
             
             # Fill application form
             success = await self.browser_engine.fill_application_form(
-                selectors["application"], 
+                selectors.application, 
                 application_data
             )
             
@@ -197,9 +344,10 @@ class WebsiteManager:
             # Submit application
             submission_result = await self.browser_engine.submit_application()
             
-            # Take screenshot for verification
+            # Take screenshot for verification; the nanosecond timestamp keeps
+            # names unique even for applications in the same second
             screenshot_path = await self.browser_engine.take_screenshot(
-                f"application_{job_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+                f"application_{job_id}_{time.time_ns()}.png"
             )
             
             return {
@@ -210,7 +358,10 @@ class WebsiteManager:
                 "timestamp": datetime.utcnow().isoformat()
             }
             
-        except Exception as e:
+        # BrowserEngine reports driver failures as return values; these cover
+        # a missing site and malformed job or submission data. Anything else
+        # propagates to the caller (bulk_apply reports it per job).
+        except (ValueError, KeyError, AttributeError) as e:
             return {
                 "success": False,
                 "message": f"Error applying to job: {str(e)}",
@@ -230,37 +381,45 @@ class WebsiteManager:
             
             max_apps = min(len(jobs), self.current_site.max_applications_per_session)
             
-            for i, job in enumerate(jobs[:max_apps]):
-                try:
-                    # Apply rate limiting
-                    if i > 0:
-                        await asyncio.sleep(self.current_site.rate_limit_delay)
-                    
-                    # Apply to job
-                    result = await self.apply_to_job(job["id"], application_data)
-                    
-                    if result["success"]:
-                        results["successful_applications"] += 1
-                    else:
-                        results["failed_applications"] += 1
-                        results["errors"].append({
-                            "job_id": job["id"],
-                            "error": result["message"]
-                        })
-                    
-                    results["applications"].append({
-                        "job_id": job["id"],
-                        "job_title": job.get("title", "Unknown"),
-                        "company": job.get("company", "Unknown"),
-                        "result": result
-                    })
-                    
-                except Exception as e:
+            # Applications share one browser page, so they run one at a time
+            rate_limiter = self.rate_limiters[self.current_site.key]
+            rate_limiter.reset()
+            
+            # Sites without auto-apply answer every job with a manual
+            # application result without touching the site, so nothing to pace
+            auto_apply = self.current_site.supports_auto_apply
+            
+            for job in jobs[:max_apps]:
+                # Apply rate limiting
+                if auto_apply:
+                    await rate_limiter.acquire()
+                
+                # Apply to job; errors come back as failed results. Only failures
+                # marked retry_later (pages that don't load, unexpected errors)
+                # may mean the site is throttling us; a form that can't be
+                # filled or a manual-only site doesn't
+                result = await self._apply_one(job, application_data)
+                if result["success"]:
+                    rate_limiter.record_result(True)
+                elif result.get("retry_later"):
+                    rate_limiter.record_result(False)
+                
+                job_id = job.get("id", "unknown")
+                if result["success"]:
+                    results["successful_applications"] += 1
+                else:
                     results["failed_applications"] += 1
                     results["errors"].append({
-                        "job_id": job.get("id", "unknown"),
-                        "error": str(e)
+                        "job_id": job_id,
+                        "error": result["message"]
                     })
+                
+                results["applications"].append({
+                    "job_id": job_id,
+                    "job_title": job.get("title", "Unknown"),
+                    "company": job.get("company", "Unknown"),
+                    "result": result
+                })
             
             return results
             
@@ -289,30 +448,76 @@ class WebsiteManager:
     
     async def close_connection(self):
         """Close connection to current site"""
-        if self.browser_engine:
-            self.browser_engine.close_browser()
+        if self._browser_engine:
+            self._browser_engine.close_browser()
         self.current_site = None
+        self._session_user = None
     
     def get_supported_sites(self) -> List[Dict[str, Any]]:
         """Get list of all supported job sites"""
-        sites = []
-        for site_key, site_config in self.supported_sites.items():
-            sites.append({
-                "key": site_key,
-                "name": site_config.name,
-                "base_url": site_config.base_url,
-                "login_required": site_config.login_required,
-                "supports_auto_apply": site_config.supports_auto_apply,
-                "max_applications": site_config.max_applications_per_session
-            })
-        return sites
+        # Built once in __init__; callers get copies so they can't alter it
+        return [dict(site) for site in self._supported_sites_summary]
     
     # Private helper methods
+    def _store_search_results(self, cache_key: tuple, jobs: List[Dict]):
+        """Cache search results, dropping entries that have expired"""
+        now = time.monotonic()
+        expired = [
+            key for key, (fetched_at, _) in self._search_cache.items()
+            if now - fetched_at >= SEARCH_CACHE_TTL
+        ]
+        for key in expired:
+            del self._search_cache[key]
+        
+        self._search_cache[cache_key] = (now, jobs)
+    
+    def _search_cache_key(self, search_data: Dict[str, Any]) -> Optional[tuple]:
+        """Key for caching a search on the current site, or None if it can't be hashed
+        
+        Includes the logged-in account, since signed-in searches can return
+        results specific to that user. Lists (e.g. several locations) become
+        tuples; other unhashable values skip the cache.
+        """
+        fields = tuple(
+            (name, tuple(value) if isinstance(value, list) else value)
+            for name, value in sorted(search_data.items())
+        )
+        cache_key = (self._session_user, self.current_site.key, fields)
+        try:
+            hash(cache_key)
+        except TypeError:
+            return None
+        return cache_key
+    
+    async def _run_search(self, search_data: Dict[str, Any]) -> List[Dict]:
+        """Fill the current site's search form and read the listings"""
+        # Navigate to search page
+        await self.browser_engine.navigate_to_website(self.current_site.search_url)
+        
+        selectors = self.current_site.selectors
+        
+        # Fill search form
+        await self.browser_engine.fill_search_form(selectors.search, search_data)
+        
+        # Get job listings
+        return await self._extract_job_listings(selectors.job_listings)
+    
+    async def _apply_one(self, job: Dict, application_data: Dict) -> Dict[str, Any]:
+        """Apply to a single job from a bulk run, reporting errors as a failed result"""
+        try:
+            return await self.apply_to_job(job["id"], application_data)
+        except Exception as e:
+            return {
+                "success": False,
+                "message": str(e),
+                "error_type": type(e).__name__,
+                "retry_later": True
+            }
+    
     async def _perform_login(self, site_name: str, credentials: Dict) -> bool:
         """Perform login for sites that require authentication"""
         try:
-            selectors = get_selectors_for_site(site_name)
-            login_selectors = selectors.get("login", {})
+            login_selectors = self.current_site.selectors.login
             
             if not login_selectors:
                 return False
@@ -335,47 +540,28 @@ class WebsiteManager:
             
             return False
             
-        except Exception as e:
-            print(f"Login error for {site_name}: {str(e)}")
+        except Exception:
+            logger.exception("Login error for %s", site_name)
             return False
     
     async def _extract_job_listings(self, job_selectors: Dict) -> List[Dict]:
         """Extract job listings from current page"""
-        try:
-            # This would use selenium to extract job data
-            # For now, return mock data
-            
-            mock_jobs = [
-                {
-                    "id": f"job_{i}",
-                    "title": f"Python Developer {i}",
-                    "company": f"Tech Company {i}",
-                    "location": "Remote",
-                    "description": f"Job description for position {i}",
-                    "url": f"https://example.com/job/{i}",
-                    "posted_date": datetime.utcnow().isoformat(),
-                    "source": self.current_site.name
-                }
-                for i in range(1, 6)
-            ]
-            
-            return mock_jobs
-            
-        except Exception as e:
-            print(f"Error extracting job listings: {str(e)}")
-            return []
+        # This would use selenium to extract job data
+        # For now, return mock data
+        
+        posted_date = datetime.utcnow().isoformat()
+        mock_jobs = [
+            {**job, "posted_date": posted_date, "source": self.current_site.name}
+            for job in _MOCK_JOBS
+        ]
+        
+        return mock_jobs
     
     def _build_job_url(self, job_id: str) -> str:
         """Build full URL for a specific job"""
-        base_url = self.current_site.base_url
-        if "linkedin" in base_url:
-            return f"{base_url}/jobs/view/{job_id}"
-        elif "indeed" in base_url:
-            return f"{base_url}/viewjob?jk={job_id}"
-        elif "naukri" in base_url:
-            return f"{base_url}/job-listings-{job_id}"
-        else:
-            return f"{base_url}/job/{job_id}"
+        return self.current_site.job_url_template.format(
+            base_url=self.current_site.base_url, job_id=job_id
+        )
 
 
 # Global website manager instance